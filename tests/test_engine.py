@@ -2,10 +2,10 @@
 
 import warnings
 
-from windcalc import EstimateInput, calculate
+from windcalc import EstimateInput, calculate, calculate_project
 from windcalc.engine import calculate_wind_load
 from windcalc.risk import classify_risk
-from windcalc.schemas import FenceSpecs, WindConditions, WindLoadRequest
+from windcalc.schemas import FenceSpecs, ProjectInput, WindConditions, WindLoadRequest
 
 
 def test_calculate_bay_outputs():
@@ -362,3 +362,16 @@ def test_legacy_api_still_available():
     assert result.total_load > 0
     assert result.fence_specs == fence
     assert result.wind_conditions == wind
+
+
+def test_segments_with_same_factors_share_design_parameters():
+    seg = {"height_total_ft": 8, "post_spacing_ft": 10, "fence_length_ft": 200}
+    project = ProjectInput(
+        wind_speed_mph=115,
+        segments=[seg, {**seg, "label": "B", "post_spacing_ft": 8}, {**seg, "height_total_ft": 6}],
+    )
+    segments = calculate_project(project).segments
+    assert isinstance(segments, tuple)
+    first, second, third = (s.estimate.shared.design_params for s in segments)
+    assert first is second
+    assert first != third
@@ -0,0 +1,115 @@
+"""Tests for the post catalog spacing and capacity helpers."""
+
+import pytest
+
+from windcalc import post_catalog
+from windcalc.post_catalog import (
+    POST_TYPES,
+    bending_capacity_lb_in,
+    compute_deflection_check,
+    compute_max_spacing_cf,
+    compute_max_spacing_from_tables,
+    compute_moment_check,
+    make_bending_fn,
+    make_spacing_fn,
+    section_modulus_pipe,
+    spacing_for_all_posts,
+)
+
+
+@pytest.fixture
+def spacing_tables(tmp_path, monkeypatch):
+    """Point the table loader at two small CSV tables (110 and 120 mph)."""
+    header = "Group,Post Label,4,6,8,10,12\n"
+    (tmp_path / "110mph.csv").write_text(header + 'IC_PIPE,2 3/8",12.0,10.0,8.0,6.0,-\n')
+    (tmp_path / "120mph.csv").write_text(header + 'IC_PIPE,2 3/8",11.0,9.0,7.0,5.0,4.0\n')
+    monkeypatch.setattr(post_catalog, "TABLE_DIR", tmp_path)
+    monkeypatch.setattr(post_catalog, "_AVAILABLE_WS", [110, 120])
+    post_catalog._load_ws_tables.cache_clear()
+    yield
+    post_catalog._load_ws_tables.cache_clear()
+
+
+@pytest.mark.parametrize("exposure", ["B", "C", "D"])
+@pytest.mark.parametrize("wind_speed", [100, 112.5, 130])
+def test_spacing_for_all_posts_matches_per_post(wind_speed, exposure):
+    spacings = dict(spacing_for_all_posts(wind_speed, exposure))
+    assert spacings.keys() == POST_TYPES.keys()
+    for key, s_max in spacings.items():
+        assert s_max == compute_max_spacing_cf(key, wind_speed, exposure)
+
+
+def test_checks_accept_resolved_post_type():
+    post = POST_TYPES["2_7_8_SS40"]
+    assert compute_max_spacing_cf(post, 120, "C") == compute_max_spacing_cf(
+        "2_7_8_SS40", 120, "C"
+    )
+    assert compute_moment_check(post, 8, 400) == compute_moment_check("2_7_8_SS40", 8, 400)
+    assert compute_deflection_check(post, 8, 400) == compute_deflection_check(
+        "2_7_8_SS40", 8, 400
+    )
+
+
+@pytest.mark.usefixtures("spacing_tables")
+class TestTableLookup:
+    def test_uses_next_higher_wind_speed_table(self):
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 105, 8) == 8.0
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 110, 8) == 8.0
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 115, 8) == 7.0
+
+    def test_above_last_table_uses_last_table(self):
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 140, 8) == 7.0
+
+    def test_uses_next_taller_height_column(self):
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 120, 7) == 7.0
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 120, 10) == 5.0
+
+    def test_taller_than_table_uses_tallest_column(self):
+        assert compute_max_spacing_from_tables("2_3_8_SS40", 110, 14) == 6.0
+
+    def test_post_without_table_label(self):
+        assert compute_max_spacing_from_tables("2_3_8_S80", 110, 8) is None
+
+
+def test_ragged_table_falls_back_to_csv_reader(tmp_path, monkeypatch):
+    (tmp_path / "110mph.csv").write_text(
+        "Group,Post Label,4,6\n"
+        'IC_PIPE,2 3/8",12.0,10.0\n'
+        'IC_PIPE,2 7/8",12.0,10.0,9.0\n'
+    )
+    monkeypatch.setattr(post_catalog, "TABLE_DIR", tmp_path)
+    post_catalog._load_ws_tables.cache_clear()
+    try:
+        tables = post_catalog._load_ws_tables(110)
+    finally:
+        post_catalog._load_ws_tables.cache_clear()
+    assert tables["IC_PIPE"]['2 3/8"'] == ((4.0, 6.0), (12.0, 10.0))
+    assert tables["IC_PIPE"]['2 7/8"'] == ((4.0, 6.0), (12.0, 10.0))
+
+
+def test_factor_tables_are_read_only():
+    with pytest.raises(TypeError):
+        post_catalog.EXPOSURE_CF2["B"] = 2.0
+    for rows in post_catalog.CF1_TABLE.values():
+        assert list(rows) == sorted(rows)
+
+
+def test_moment_check_matches_closed_form():
+    post = POST_TYPES["2_7_8_SS40"]
+    demand, allow, ok = compute_moment_check(post, 8, 400)
+    assert demand == pytest.approx(400 * 4 * 12)
+    s_in3 = section_modulus_pipe(post.od_in, post.wall_in)
+    assert allow == pytest.approx(bending_capacity_lb_in(s_in3, post.fy_ksi))
+    assert isinstance(ok, bool)
+
+
+@pytest.mark.parametrize("post_key", sorted(POST_TYPES))
+def test_specialised_helpers_match_generic_checks(post_key):
+    spacing = make_spacing_fn(post_key, "C")
+    check = make_bending_fn(post_key)
+    for wind_speed in (105, 115, 130):
+        assert spacing(wind_speed) == pytest.approx(
+            compute_max_spacing_cf(post_key, wind_speed, "C")
+        )
+    for height, load in ((6, 250), (12, 900)):
+        assert check(height, load) == pytest.approx(compute_moment_check(post_key, height, load))
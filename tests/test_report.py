@@ -1,10 +1,13 @@
 """Tests for windcalc report module."""
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
 from windcalc import EstimateInput, calculate
-from windcalc.report import draw_pdf, generate_pdf_report
+from windcalc.report import draw_pdf, draw_pdfs, generate_pdf_report
+from windcalc.report_layout import _KV_TABLE_STYLE, _emit_table, _LegacyView
 
 
 def test_draw_pdf_from_estimate():
@@ -55,3 +58,48 @@ def test_generate_pdf_report_legacy():
         assert output_path.stat().st_size > 0
     finally:
         output_path.unlink(missing_ok=True)
+
+
+def test_draw_pdf_status_sections(tmp_path):
+    inp = EstimateInput(wind_speed_mph=100, height_total_ft=6, post_spacing_ft=8, exposure="C")
+    result = calculate(inp)
+    details = {
+        "reasons": ["Line post spacing near limit", "Footing SF < 1.5 & review"],
+        "line_spacing_ratio": 0.9,
+        "terminal_bending_ratio": 0.5,
+    }
+    for status in ("GREEN", "YELLOW", "RED"):
+        output_path = tmp_path / f"{status}.pdf"
+        draw_pdf(output_path, inp, result, risk_status=status, risk_details=details)
+        assert output_path.stat().st_size > 0
+
+
+def test_emit_table_splits_long_tables():
+    story: list = []
+    _emit_table(story, [["row", str(i)] for i in range(1201)], _KV_TABLE_STYLE)
+    assert [len(table._cellvalues) for table in story] == [500, 500, 201]
+
+
+def test_legacy_view_defaults_missing_fields():
+    view = _LegacyView.from_dict({"design_pressure": 25.0, "fence_specs": {"height": 6.0}})
+    assert view.result_rows() == [["Design Pressure", "25.0 psf"], ["Total Load", "N/A lbs"]]
+    assert view.fence_rows()[0] == ["Height", "6.0 ft"]
+    assert view.wind_rows()[1] == ["Exposure Category", "N/A"]
+    assert view.calculation_notes is None
+
+
+def test_draw_pdfs_writes_every_report(tmp_path):
+    jobs = []
+    for speed in (100, 115, 130):
+        inp = EstimateInput(
+            wind_speed_mph=speed, height_total_ft=6, post_spacing_ft=8, exposure="C"
+        )
+        jobs.append((tmp_path / f"{speed}.pdf", inp, calculate(inp)))
+    draw_pdfs(jobs, max_workers=2)
+    assert all(path.stat().st_size > 0 for path, _, _ in jobs)
+
+
+def test_importing_report_does_not_load_reportlab():
+    code = "import sys, windcalc.report; print('reportlab' in sys.modules)"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == "False"
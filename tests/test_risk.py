@@ -134,3 +134,15 @@ class TestClassifyRiskEdgeCases:
         # Both should work without errors
         assert details_open is not None
         assert details_solid is not None
+
+
+def test_classify_risk_without_details_keeps_status_and_ratios():
+    out = calculate(
+        EstimateInput(wind_speed_mph=130, height_total_ft=10, post_spacing_ft=12, exposure="D")
+    )
+    status, details = classify_risk(out, {"post_spacing_ft": 12})
+    quick_status, quick = classify_risk(out, {"post_spacing_ft": 12}, build_details=False)
+    assert quick_status == status
+    assert quick["reasons"] == [] and quick["advanced_reasons"] == []
+    assert quick["line_spacing_ratio"] == details["line_spacing_ratio"]
+    assert quick["terminal_bending_ratio"] == details["terminal_bending_ratio"]
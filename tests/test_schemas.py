@@ -1,10 +1,22 @@
 """Tests for windcalc schemas."""
 
+import subprocess
+import sys
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
 
+from windcalc import calculate
+from windcalc.asce7 import FENCE_TYPES, FenceTypeKey
+from windcalc.footing import SOIL_CLASSES, SoilClassKey
 from windcalc.schemas import (
+    BlockResult,
+    EstimateInput,
+    EstimateOutput,
     FenceSpecs,
+    ProjectInput,
+    Recommendation,
     WindConditions,
     WindLoadRequest,
     WindLoadResult,
@@ -63,3 +75,99 @@ def test_wind_load_result_valid():
     )
     assert result.design_pressure == 25.0
     assert result.total_load == 15000.0
+
+
+def test_result_models_defer_schema_build():
+    code = (
+        "from windcalc.schemas import EstimateInput, ProjectOutput; "
+        "print(ProjectOutput.__pydantic_complete__, EstimateInput.__pydantic_complete__)"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.split() == ["False", "True"]
+
+
+def test_estimate_input_derived_values_follow_changes():
+    inp = EstimateInput(
+        wind_speed_mph=100, height_total_ft=6, post_spacing_ft=8, fence_length_ft=120
+    )
+    assert inp.area_per_bay_ft2 == 48.0
+    assert inp.model_copy(update={"fence_length_ft": 30}).aspect_ratio_bs == 5.0
+    inp.post_spacing_ft = 10
+    assert inp.model_dump()["area_per_bay_ft2"] == 60.0
+
+
+def test_catalog_keys_are_literals():
+    assert set(get_args(FenceTypeKey)) == FENCE_TYPES.keys()
+    assert set(get_args(SoilClassKey)) == SOIL_CLASSES.keys()
+
+    base = {"wind_speed_mph": 100, "height_total_ft": 6, "post_spacing_ft": 8}
+    with pytest.raises(ValidationError):
+        EstimateInput(**base, fence_type="picket")
+    with pytest.raises(ValidationError):
+        EstimateInput(**base, soil_type="mud")
+
+
+def test_result_blocks_are_frozen():
+    out = calculate(EstimateInput(wind_speed_mph=110, height_total_ft=6, post_spacing_ft=8))
+    with pytest.raises(ValidationError):
+        out.shared.pressure_psf = 0.0
+    with pytest.raises(ValidationError):
+        out.line.status = "GREEN"
+    assert isinstance(out.line.warnings, tuple)
+    assert isinstance(out.line.assumptions, tuple)
+    with pytest.raises(ValidationError):
+        out.line.recommended.post_key = None
+    with pytest.raises(ValidationError):
+        out.shared.design_params.model_validate(
+            {**out.shared.design_params.model_dump(), "unexpected": 1}
+        )
+
+
+def test_result_field_descriptions_reach_json_schema():
+    schema = EstimateOutput.model_json_schema()["$defs"]
+    assert schema["DesignParameters"]["properties"]["kz"]["description"] == (
+        "Velocity pressure exposure coefficient."
+    )
+    assert "description" in schema["BlockResult"]["properties"]["spacing_ratio"]
+    assert schema["BlockResult"]["description"] == "Checks for one post role (line or terminal)."
+
+
+def test_block_without_post_shares_empty_recommendation():
+    first, second = BlockResult(), BlockResult()
+    assert first.recommended is second.recommended
+    assert first.recommended == Recommendation()
+
+
+def test_exposure_is_upper_cased_without_python_validator():
+    seg = {"height_total_ft": 6, "post_spacing_ft": 8, "fence_length_ft": 100}
+    assert ProjectInput(wind_speed_mph=110, exposure="d", segments=[seg]).exposure == "D"
+    assert "_normalize_exposure" not in EstimateInput.__pydantic_decorators__.field_validators
+    assert EstimateInput.model_json_schema()["properties"]["exposure"]["enum"] == ["B", "C", "D"]
+
+
+def test_check_records_are_slotted_dataclasses():
+    out = calculate(EstimateInput(wind_speed_mph=110, height_total_ft=6, post_spacing_ft=8))
+    footing = out.line.footing
+    assert not hasattr(footing, "__dict__")
+    with pytest.raises(AttributeError):
+        footing.safety_factor = 0.0
+    assert out.model_dump()["line"]["deflection"]["ratio"] == out.line.deflection.ratio
+
+
+def test_result_build_skips_validation_but_fills_defaults():
+    block = BlockResult.build(post_key="2_3_8_SS40", max_spacing_ft=9.5)
+    assert block.warnings == ()
+    assert block.status == "GREEN"
+    assert block == BlockResult(post_key="2_3_8_SS40", max_spacing_ft=9.5)
+    assert BlockResult.build(status="not-a-status").status == "not-a-status"
+
+
+def test_estimate_output_legacy_fields_mirror_blocks():
+    out = calculate(
+        EstimateInput(wind_speed_mph=120, height_total_ft=8, post_spacing_ft=10)
+    )
+    dumped = out.model_dump()
+    assert dumped["pressure_psf"] == out.shared.pressure_psf
+    assert dumped["recommended"] == dumped["line"]["recommended"]
+    assert dumped["warnings"] == out.line.warnings + out.terminal.warnings
+    assert EstimateOutput.model_validate(dumped) == out
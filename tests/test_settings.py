@@ -0,0 +1,35 @@
+"""Tests for application settings."""
+
+from pathlib import Path
+
+from windcalc.settings import Settings, get_settings
+
+
+def test_report_dir_defaults_under_home():
+    assert Settings().report_dir == Path.home() / "Windload Reports"
+
+
+def test_no_env_file_skips_dotenv(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("WINDCALC_PORT=9999\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("WINDCALC_PORT", raising=False)
+
+    get_settings.cache_clear()
+    try:
+        assert get_settings().port == 9999
+        get_settings.cache_clear()
+        monkeypatch.setenv("WINDCALC_NO_ENV_FILE", "1")
+        assert get_settings().port == 8000
+    finally:
+        get_settings.cache_clear()
+
+
+def test_cors_origins_from_env(monkeypatch):
+    monkeypatch.setenv("WINDCALC_CORS_ORIGINS", "https://a.example, https://b.example")
+    assert Settings(_env_file=None).cors_origins == ("https://a.example", "https://b.example")
+
+    monkeypatch.setenv("WINDCALC_CORS_ORIGINS", '["https://c.example"]')
+    assert Settings(_env_file=None).cors_origins == ("https://c.example",)
+
+    monkeypatch.delenv("WINDCALC_CORS_ORIGINS")
+    assert "http://localhost:8000" in Settings(_env_file=None).cors_origins
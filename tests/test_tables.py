@@ -5,6 +5,8 @@ import pandas as pd
 from windcalc.tables import (
     create_results_dataframe,
     create_summary_table,
+    export_to_csv,
+    export_to_excel,
 )
 
 
@@ -55,3 +57,40 @@ def test_create_summary_table_with_data():
     assert len(summary) == 3
     assert "metric" in summary.columns
     assert "value" in summary.columns
+
+
+def test_create_summary_table_missing_column():
+    """A column absent from the results reports a mean of 0."""
+    df = create_results_dataframe([{"design_pressure": 20.0}, {"design_pressure": 30.0}])
+    summary = create_summary_table(df).set_index("metric")["value"]
+
+    assert summary["mean_design_pressure"] == 25.0
+    assert summary["mean_total_load"] == 0
+    assert summary.dtype == "float64"
+
+
+def test_export_round_trip(tmp_path):
+    """CSV and Excel exports read back with the same rows; NaN cells stay blank."""
+    df = pd.DataFrame(
+        {"design_pressure": [20.0, float("nan")], "post": ["2_3_8_SS40", "4_0_PIPE"]}
+    )
+
+    csv_path = tmp_path / "results.csv"
+    export_to_csv(df, str(csv_path))
+    pd.testing.assert_frame_equal(pd.read_csv(csv_path), df, check_dtype=False)
+
+    xlsx_path = tmp_path / "results.xlsx"
+    export_to_excel(df, str(xlsx_path))
+    pd.testing.assert_frame_equal(pd.read_excel(xlsx_path), df, check_dtype=False)
+
+
+def test_export_rows_to_csv_without_dataframe(tmp_path):
+    """Raw result rows are written like their DataFrame would be."""
+    rows = [{"design_pressure": 20.0, "post": "2_3_8_SS40"}, {"total_load": 900.5}]
+
+    direct = tmp_path / "direct.csv"
+    via_df = tmp_path / "via_df.csv"
+    export_to_csv(rows, str(direct))
+    export_to_csv(create_results_dataframe(rows), str(via_df))
+
+    assert direct.read_text() == via_df.read_text()
@@ -20,7 +20,7 @@ from windcalc.post_catalog import (
     moment_of_inertia_pipe,
     section_modulus_pipe,
 )
-from windcalc.quantities import compute_segment_quantities
+from windcalc.quantities import ProjectQuantities, compute_segment_quantities
 from windcalc.schemas import ProjectInput, SegmentInput
 from windcalc.wind_speed_lookup import lookup_wind_speed
 
@@ -247,6 +247,21 @@ class TestQuantities:
         assert sq.num_gate_posts == 2
         assert sq.total_posts == sq.num_line_posts + 2 + 4 + 2
 
+    def test_project_totals_snapshot(self):
+        pq = ProjectQuantities(segments=[
+            compute_segment_quantities(fence_length_ft=200, height_ft=8, post_spacing_ft=10),
+            compute_segment_quantities(
+                fence_length_ft=150, height_ft=6, post_spacing_ft=8, num_gates=2,
+            ),
+        ])
+        totals = pq.totals_snapshot()
+        assert totals.total_posts == sum(s.total_posts for s in pq.segments)
+        assert totals.total_gate_posts == 2
+        assert totals.total_top_rail_lf == 350.0
+        assert totals.total_fabric_sf == 2500.0
+        assert totals.total_concrete_cy == round(totals.total_concrete_cf / 27.0, 2)
+        assert pq.total_concrete_cf == totals.total_concrete_cf
+
 
 class TestGateCornerPosts:
     """Tier B #7: Gate/corner as distinct roles."""
@@ -363,6 +378,41 @@ class TestCSVParserReadiness:
         result = compute_max_spacing_from_tables("2_3_8_SS40", 120, 8)
         assert result is None  # No CSV files yet
 
+    def test_pandas_and_csv_readers_agree(self, tmp_path):
+        from windcalc.post_catalog import _read_ws_rows_csv, _read_ws_rows_pandas
+
+        path = tmp_path / "105mph.csv"
+        path.write_text(
+            "Group,Post Label,4,6,8,10,12\n"
+            'IC_PIPE,1 7/8",10.0,8.0,6.5,-,-\n'
+            'IC_PIPE,4",-,-,14.0,12.0,\n',
+            encoding="utf-8-sig",
+        )
+        rows = _read_ws_rows_pandas(path)
+        assert rows == _read_ws_rows_csv(path)
+        assert rows[0] == ("IC_PIPE", '1 7/8"', {4.0: 10.0, 6.0: 8.0, 8.0: 6.5})
+        assert rows[1] == ("IC_PIPE", '4"', {8.0: 14.0, 10.0: 12.0})
+
+    def test_readers_agree_on_na_like_cells(self, tmp_path):
+        from windcalc.post_catalog import _read_ws_rows_csv, _read_ws_rows_pandas
+
+        path = tmp_path / "110mph.csv"
+        path.write_text(
+            "Group,Post Label,4,,NA,8\n"
+            "IC_PIPE,NA,10.0,N/A,null,6.5\n"
+            "IA_REG,None,-,nan, 7.5 ,\n"
+            "IC_PIPE,N/A,,,,\n",
+            encoding="utf-8-sig",
+        )
+        rows = _read_ws_rows_pandas(path)
+        assert rows == _read_ws_rows_csv(path)
+        # Blank and non-numeric header cells both parse as height 0.0.
+        assert rows == [
+            ("IC_PIPE", "NA", {4.0: 10.0, 8.0: 6.5}),
+            ("IA_REG", "None", {0.0: 7.5}),
+            ("IC_PIPE", "N/A", {}),
+        ]
+
 
 class TestApiEndpoints:
     """Test new API endpoints."""
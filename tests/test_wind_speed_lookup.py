@@ -0,0 +1,96 @@
+"""Tests for the ZIP-prefix wind speed table."""
+
+from itertools import pairwise
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from windcalc.wind_speed_lookup import lookup_wind_speed, lookup_wind_speed_batch
+
+
+@pytest.mark.parametrize(
+    ("zip_code", "expected"),
+    [
+        ("02108", (115, "New England")),
+        ("07030", (110, "New Jersey / Connecticut")),
+        ("22401", (115, "Virginia")),
+        ("23510", (125, "Virginia Tidewater")),
+        ("21201", (115, "Maryland")),
+        ("20001", (115, "DC / Maryland")),
+        ("96813", (130, "Hawaii (Windward)")),
+        ("95814", (95, "California (Northern)")),
+    ],
+)
+def test_prefix_regions(zip_code, expected):
+    assert lookup_wind_speed(zip_code) == expected
+
+
+def test_range_edges():
+    assert lookup_wind_speed("88499")[1] == "New Mexico"
+    assert lookup_wind_speed("88599") == (None, "ZIP code region not in database")
+    assert lookup_wind_speed("00501") == (None, "ZIP code region not in database")
+
+
+def test_ranges_are_sorted_and_disjoint():
+    from windcalc.wind_speed_lookup import _RANGES
+
+    assert all(0 <= start < end <= 1000 for start, end, _, _ in _RANGES)
+    for (_, prev_end, _, _), (start, _, _, _) in pairwise(_RANGES):
+        assert prev_end <= start
+
+
+def test_nested_regions_override_outer_ones():
+    assert lookup_wind_speed("22901") == (115, "Virginia")
+    assert lookup_wind_speed("23451") == (125, "Virginia Tidewater")
+    assert lookup_wind_speed("24001") == (115, "Virginia")
+    assert lookup_wind_speed("21201")[1] == "Maryland"
+
+
+@pytest.mark.parametrize(
+    "zip_code", ["ABCDE", "-1234", "+1234", " 1234", "1_234", "\u00b2\u00b3\u00b9", ""]
+)
+def test_non_numeric_zip_is_invalid(zip_code):
+    assert lookup_wind_speed(zip_code) == (None, "Invalid ZIP code")
+
+
+def test_bytes_zip_matches_str():
+    assert lookup_wind_speed(b"33101", "III") == lookup_wind_speed("33101", "III")
+    assert lookup_wind_speed(b"1_234") == (None, "Invalid ZIP code")
+    speeds, regions = lookup_wind_speed_batch(np.array([b"33101", b"88599"]))
+    assert speeds.tolist() == [lookup_wind_speed("33101")[0], -1]
+    assert regions[1] == "ZIP code region not in database"
+
+
+def test_batch_treats_non_string_items_as_invalid():
+    zips = pd.Series(["33101", float("nan"), 33101, None], dtype=object)
+    speeds, regions = lookup_wind_speed_batch(zips.to_numpy())
+    assert speeds.tolist() == [lookup_wind_speed("33101")[0], -1, -1, -1]
+    assert regions[1:] == ["Invalid ZIP code"] * 3
+    assert lookup_wind_speed(33101) == (None, "Invalid ZIP code")
+
+
+def test_equal_results_share_one_tuple():
+    first = lookup_wind_speed("33101", "III")
+    assert lookup_wind_speed("33199", "III") is first
+    assert lookup_wind_speed("33101", "III") is first
+
+
+@pytest.mark.parametrize("risk_category", ["I", "II", "III", "IV", "X"])
+def test_batch_matches_single_lookups(risk_category):
+    zips = [f"{prefix:03d}42" for prefix in range(1000)] + ["", "12", "ABCDE"]
+    speeds, regions = lookup_wind_speed_batch(zips, risk_category)
+    assert speeds.dtype == "int16"
+    for zip_code, speed, region in zip(zips, speeds.tolist(), regions, strict=True):
+        expected_speed, expected_region = lookup_wind_speed(zip_code, risk_category)
+        assert speed == (-1 if expected_speed is None else expected_speed)
+        assert region == expected_region
+
+
+def test_tables_are_read_only():
+    from windcalc import wind_speed_lookup
+
+    with pytest.raises(TypeError):
+        wind_speed_lookup._RISK_MULTIPLIER["II"] = 2.0
+    with pytest.raises(TypeError):
+        wind_speed_lookup._results_by_risk()["II"] = ()
@@ -13,6 +13,7 @@ for Buildings and Other Structures*.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Literal
 
 # ── ASCE 7-22 Edition Tag ────────────────────────────────────────────
 ASCE7_EDITION = "ASCE 7-22"
@@ -49,6 +50,16 @@ CF_SOLID_LONG_FENCE = 1.5
 
 
 # ── Fence Types ──────────────────────────────────────────────────────
+# Keys of FENCE_TYPES, spelled out so input schemas can reject unknown types.
+FenceTypeKey = Literal[
+    "chain_link_open",
+    "chain_link_windscreen_50",
+    "chain_link_windscreen_80",
+    "chain_link_slats",
+    "solid_panel",
+]
+
+
 @dataclass(frozen=True)
 class FenceTypeInfo:
     """Definition of a fence type with its solidity ratio."""
@@ -242,7 +253,7 @@ class DesignPressureResult:
     cf_solid: float
     cf: float
     solidity: float
-    fence_type: str
+    fence_type: FenceTypeKey
     asce7_edition: str = ASCE7_EDITION
 
 
@@ -252,7 +263,7 @@ def compute_design_pressure(
     exposure: str,
     solidity: float,
     kzt: float = 1.0,
-    fence_type: str = "chain_link_open",
+    fence_type: FenceTypeKey = "chain_link_open",
     aspect_ratio_bs: float | None = None,
 ) -> DesignPressureResult:
     """Full design wind pressure on a fence surface.
@@ -275,7 +286,7 @@ def compute_design_pressure(
         Solidity ratio (0.0 to 1.0).
     kzt : float
         Topographic factor (default 1.0).
-    fence_type : str
+    fence_type : FenceTypeKey
         Fence type key for documentation.
     aspect_ratio_bs : float or None
         Optional B/s ratio.
@@ -313,6 +324,7 @@ __all__ = [
     "KD_FENCE",
     "DesignPressureResult",
     "FenceTypeInfo",
+    "FenceTypeKey",
     "compute_cf",
     "compute_cf_solid",
     "compute_design_pressure",
@@ -6,7 +6,6 @@ from pathlib import Path
 import click
 
 from windcalc.engine import calculate_wind_load
-from windcalc.report import generate_pdf_report
 from windcalc.schemas import FenceSpecs, WindConditions, WindLoadRequest
 
 
@@ -64,6 +63,8 @@ def calculate(
 @click.option("--output", type=click.Path(), help="Output PDF file path")
 def report(input_file: str, output: str | None):
     """Generate PDF report from calculation results."""
+    from windcalc.report import generate_pdf_report
+
     input_path = Path(input_file)
     data = json.loads(input_path.read_text())
 
@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import logging
 import warnings
+from functools import lru_cache
 
 from windcalc.asce7 import FENCE_TYPES as ASCE_FENCE_TYPES
-from windcalc.asce7 import compute_design_pressure
+from windcalc.asce7 import DesignPressureResult, compute_design_pressure
 from windcalc.footing import compute_footing_check
 from windcalc.post_catalog import (
     POST_TYPES,
@@ -252,9 +253,10 @@ def _compute_block(
     footing_result: FootingResult | None = None
     deflection_result: DeflectionResult | None = None
 
-    if effective_key and effective_key in POST_TYPES:
+    post_obj = POST_TYPES.get(effective_key) if effective_key else None
+    if post_obj is not None:
         table_spacing = compute_max_spacing_from_tables(
-            post_key=effective_key,
+            post_key=post_obj,
             wind_speed_mph=data.wind_speed_mph,
             height_ft=data.height_total_ft,
         )
@@ -264,7 +266,7 @@ def _compute_block(
         else:
             max_spacing_ft = round(
                 compute_max_spacing_cf(
-                    post_key=effective_key,
+                    post_key=post_obj,
                     wind_speed_mph=data.wind_speed_mph,
                     exposure=data.exposure.upper(),
                 ),
@@ -272,22 +274,20 @@ def _compute_block(
             )
 
         if data.post_spacing_ft > max_spacing_ft:
-            post = POST_TYPES[effective_key]
             warnings_list.append(
-                f"For post {post.label} at {data.wind_speed_mph:.0f} mph and "
+                f"For post {post_obj.label} at {data.wind_speed_mph:.0f} mph and "
                 f"exposure {data.exposure}, max recommended spacing is about "
                 f"{max_spacing_ft:.2f} ft; current spacing {data.post_spacing_ft:.2f} ft "
                 "exceeds this simplified limit."
             )
 
         M_demand_lb_in, M_allow_lb_in, moment_ok = compute_moment_check(  # noqa: N806
-            post_key=effective_key,
+            post_key=post_obj,
             height_ft=data.height_total_ft,
             load_per_post_lb=load_per_post_lb,
         )
 
         # Footing check (IBC 1807.3)
-        post_obj = POST_TYPES[effective_key]
         embed_in = data.embedment_depth_in or (
             recommended.embedment_in if recommended else (post_obj.footing_embedment_in or 30.0)
         )
@@ -327,7 +327,7 @@ def _compute_block(
         # Deflection check (serviceability)
         try:
             defl_in, defl_allow_in, defl_ok = compute_deflection_check(
-                post_key=effective_key,
+                post_key=post_obj,
                 height_ft=data.height_total_ft,
                 load_per_post_lb=load_per_post_lb,
             )
@@ -381,11 +381,11 @@ def _compute_block(
     # The user should review the footing warning and increase embedment
     # if needed. This keeps the primary status focused on spacing/bending.
 
-    return BlockResult(
+    return BlockResult.build(
         post_key=effective_key,
         post_label=recommended.post_label if recommended else None,
         recommended=recommended,
-        warnings=warnings_list,
+        warnings=tuple(warnings_list),
         assumptions=_assumptions(data),
         max_spacing_ft=max_spacing_ft,
         M_demand_ft_lb=round(M_demand_lb_in / 12.0, 1) if M_demand_lb_in is not None else None,
@@ -399,6 +399,28 @@ def _compute_block(
     )
 
 
+@lru_cache(maxsize=256)
+def _design_parameters(dp: DesignPressureResult) -> DesignParameters:
+    """Return the frozen traceability block for *dp*, shared between equal inputs.
+
+    Segments of a project (and repeated API calls) with the same height,
+    exposure and fence type resolve to the same ASCE 7 factors, so they get
+    the same :class:`DesignParameters` instance instead of a new copy each.
+    """
+    return DesignParameters(
+        asce7_edition=dp.asce7_edition,
+        kz=dp.kz,
+        kzt=dp.kzt,
+        kd=dp.kd,
+        g=dp.g,
+        cf_solid=dp.cf_solid,
+        cf=dp.cf,
+        solidity=dp.solidity,
+        fence_type=dp.fence_type,
+        qz_psf=dp.qz_psf,
+    )
+
+
 def calculate(data: EstimateInput) -> EstimateOutput:
     """Calculate bay-level loads with separate line and terminal post results.
 
@@ -443,20 +465,9 @@ def calculate(data: EstimateInput) -> EstimateOutput:
     line_post_key = data.line_post_key or effective_post_key
     terminal_post_key = data.terminal_post_key or effective_post_key
 
-    design_params = DesignParameters(
-        asce7_edition=dp.asce7_edition,
-        kz=dp.kz,
-        kzt=dp.kzt,
-        kd=dp.kd,
-        g=dp.g,
-        cf_solid=dp.cf_solid,
-        cf=dp.cf,
-        solidity=dp.solidity,
-        fence_type=dp.fence_type,
-        qz_psf=dp.qz_psf,
-    )
+    design_params = _design_parameters(dp)
 
-    shared = SharedResult(
+    shared = SharedResult.build(
         pressure_psf=pressure_psf,
         area_per_bay_ft2=round(area, 2),
         total_load_lb=total_load_lb,
@@ -505,7 +516,7 @@ def calculate(data: EstimateInput) -> EstimateOutput:
             embedment_override_in=data.embedment_depth_in,
             footing_diameter_override_in=data.footing_diameter_in,
         )
-        quantities = QuantitiesResult(
+        quantities = QuantitiesResult.build(
             fence_length_ft=sq.fence_length_ft,
             num_line_posts=sq.num_line_posts,
             num_terminal_posts=sq.num_terminal_posts,
@@ -520,23 +531,13 @@ def calculate(data: EstimateInput) -> EstimateOutput:
             terminal_post_length_ft=sq.terminal_post_length_ft,
         )
 
-    # Legacy compatibility: map to line block
-    return EstimateOutput(
+    # Legacy top-level fields are derived from the shared/line blocks
+    return EstimateOutput.build(
         shared=shared,
         line=line_block,
         terminal=terminal_block,
         overall_status=overall_status,
         quantities=quantities,
-        pressure_psf=shared.pressure_psf,
-        area_per_bay_ft2=shared.area_per_bay_ft2,
-        total_load_lb=shared.total_load_lb,
-        load_per_post_lb=shared.load_per_post_lb,
-        recommended=line_block.recommended,
-        warnings=(line_block.warnings or []) + (terminal_block.warnings or []),
-        assumptions=line_block.assumptions,
-        max_spacing_ft=line_block.max_spacing_ft,
-        M_demand_ft_lb=line_block.M_demand_ft_lb,
-        M_allow_ft_lb=line_block.M_allow_ft_lb,
     )
 
 
@@ -582,7 +583,7 @@ def calculate_project(project: ProjectInput) -> ProjectOutput:
         )
         est = calculate(inp)
 
-        segment_outputs.append(SegmentOutput(
+        segment_outputs.append(SegmentOutput.build(
             label=seg.label,
             estimate=est,
             quantities=est.quantities,
@@ -607,7 +608,7 @@ def calculate_project(project: ProjectInput) -> ProjectOutput:
             _concrete += q.total_concrete_cf
             _length += q.fence_length_ft
 
-    total_q = QuantitiesResult(
+    total_q = QuantitiesResult.build(
         fence_length_ft=round(_length, 1),
         num_line_posts=_line,
         num_terminal_posts=_term,
@@ -621,7 +622,7 @@ def calculate_project(project: ProjectInput) -> ProjectOutput:
     )
 
     return ProjectOutput(
-        segments=segment_outputs,
+        segments=tuple(segment_outputs),
         overall_status=worst_status,
         total_quantities=total_q,
     )
@@ -677,7 +678,7 @@ def _build_warnings(data: EstimateInput, pressure: float, load_per_post: float)
     return warnings
 
 
-def _assumptions(data: EstimateInput) -> list[str]:
+def _assumptions(data: EstimateInput) -> tuple[str, ...]:
     fence_info = ASCE_FENCE_TYPES.get(data.fence_type)
     solidity = fence_info.solidity if fence_info else 1.0
     fence_label = fence_info.label if fence_info else data.fence_type
@@ -736,7 +737,7 @@ def _assumptions(data: EstimateInput) -> list[str]:
         "Status: GREEN (<85% utilization), "
         "YELLOW (85-100%), RED (>100%).",
     ]
-    return assumptions
+    return tuple(assumptions)
 
 
 __all__ = [
@@ -17,9 +17,14 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from typing import Literal
 
 # ── Soil Classes per IBC Table 1806.2 ───────────────────────────────
 # Lateral bearing pressure in psf per foot of depth below grade.
+SoilClassKey = Literal[
+    "rock_crystalline", "rock_sedimentary", "gravel", "sand", "clay", "default"
+]
+
 SOIL_CLASSES: dict[str, tuple[str, float]] = {
     "rock_crystalline": ("Crystalline bedrock (Class 1)", 1200.0),
     "rock_sedimentary": ("Sedimentary rock (Class 2)", 400.0),
@@ -145,5 +150,6 @@ def compute_footing_check(
 __all__ = [
     "SOIL_CLASSES",
     "FootingCheckResult",
+    "SoilClassKey",
     "compute_footing_check",
 ]
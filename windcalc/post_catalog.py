@@ -16,9 +16,14 @@ from __future__ import annotations
 import csv
 import itertools
 import math
+import sys
+import warnings
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
 PostGroup = Literal["IA_REG", "IA_HIGH", "IC_PIPE", "II_CSHAPE"]
@@ -332,6 +337,20 @@ POST_TYPES: dict[str, PostType] = {
     ),
 }
 
+
+def _intern_table_labels(posts: Iterable[PostType]) -> None:
+    """Intern each post's ``table_label`` in place.
+
+    Table labels are the join key between the catalog and the CSV
+    tables; interning them lets the loaded tables share the same objects.
+    """
+    for post in posts:
+        if post.table_label:
+            post.table_label = sys.intern(post.table_label)
+
+
+_intern_table_labels(POST_TYPES.values())
+
 # ── Manufacturer Spacing Factor Tables ─────────────────────────────
 # These are NOT ASCE 7 force coefficients.  They are manufacturer-
 # derived correction factors used to compute max allowable post
@@ -341,28 +360,29 @@ POST_TYPES: dict[str, PostType] = {
 # Cf2 decreases from B->D (more exposure -> less spacing).
 #
 # Source: HFC internal engineering reference tables.
-# Cf1 values per group & wind speed (mph)
+# Cf1 values per group & wind speed (mph).  Rows must stay sorted by
+# wind speed; get_cf1 relies on it.
 
-CF1_TABLE = {
-    "IA_REG": [
+CF1_TABLE: Mapping[PostGroup, tuple[tuple[float, float], ...]] = MappingProxyType({
+    "IA_REG": (
         (105.0, 2.2),
         (110.0, 2.0),
         (120.0, 1.7),
         (130.0, 1.4),
-    ],
-    "IA_HIGH": [
+    ),
+    "IA_HIGH": (
         (105.0, 3.7),
         (110.0, 3.4),
         (120.0, 2.8),
         (130.0, 2.4),
-    ],
-    "IC_PIPE": [
+    ),
+    "IC_PIPE": (
         (105.0, 3.1),
         (110.0, 2.8),
         (120.0, 2.4),
         (130.0, 2.0),
-    ],
-    "II_CSHAPE": [
+    ),
+    "II_CSHAPE": (
         # TODO: Replace with actual Group II C-shape values from
         # manufacturer data.  Currently duplicated from IC_PIPE as
         # a placeholder.
@@ -370,22 +390,33 @@ CF1_TABLE = {
         (110.0, 2.8),
         (120.0, 2.4),
         (130.0, 2.0),
-    ],
-}
+    ),
+})
 
 # Exposure factor Cf2 (manufacturer spacing correction, NOT ASCE 7 Kz).
 # Higher value = more allowable spacing.  B has most spacing (least wind),
 # D has least spacing (most wind).
-EXPOSURE_CF2 = {
+EXPOSURE_CF2: Mapping[str, float] = MappingProxyType({
     "B": 1.0,
     "C": 0.69,
     "D": 0.57,
-}
+})
 
 # Cf3 reserved for future adjustments (fabric, site, etc.)
 DEFAULT_CF3 = 1.0
 
 
+def _resolve_post(post: str | PostType) -> PostType:
+    """Return the catalog entry for *post*, passing PostType objects through.
+
+    Callers that check several things for the same post resolve it once
+    and hand the PostType to each ``compute_*`` helper.
+    """
+    if isinstance(post, PostType):
+        return post
+    return POST_TYPES[post]
+
+
 def get_cf1(group: PostGroup, wind_speed_mph: float) -> float:
     """Interpolate manufacturer Cf1 spacing factor for a given group and wind speed.
 
@@ -395,18 +426,14 @@ def get_cf1(group: PostGroup, wind_speed_mph: float) -> float:
         table value, which may be **non-conservative** for speeds
         above 130 mph.
     """
-    import warnings as _warnings
-
     table = CF1_TABLE[group]
-    # Sort just in case
-    table = sorted(table, key=lambda t: t[0])
 
     # Below minimum or above maximum -> clamp (with warning for high speeds)
     if wind_speed_mph <= table[0][0]:
         return table[0][1]
     if wind_speed_mph >= table[-1][0]:
         if wind_speed_mph > table[-1][0] + 5:
-            _warnings.warn(
+            warnings.warn(
                 f"Wind speed {wind_speed_mph} mph exceeds manufacturer Cf1 "
                 f"table range (max {table[-1][0]} mph). Spacing limit is "
                 "clamped and may be non-conservative.",
@@ -425,7 +452,7 @@ def get_cf1(group: PostGroup, wind_speed_mph: float) -> float:
 
 
 def compute_max_spacing_cf(
-    post_key: str,
+    post_key: str | PostType,
     wind_speed_mph: float,
     exposure: str,
     cf3: float = DEFAULT_CF3,
@@ -435,7 +462,7 @@ def compute_max_spacing_cf(
     compute the max recommended spacing S_max (ft)
     based on your Cf1/Cf2 method and the base table spacing.
     """
-    post = POST_TYPES[post_key]
+    post = _resolve_post(post_key)
 
     cf1 = get_cf1(post.group, wind_speed_mph)  # from CF1_TABLE
     cf2 = EXPOSURE_CF2[exposure]  # 1.0 / 0.69 / 0.57
@@ -445,6 +472,55 @@ def compute_max_spacing_cf(
     return s_max
 
 
+# Catalog posts grouped by Cf1 group: (key, S_table) pairs.
+_POSTS_BY_GROUP: dict[PostGroup, tuple[tuple[str, float], ...]] = {
+    group: tuple(
+        (p.key, p.spacing_base_ft) for p in POST_TYPES.values() if p.group == group
+    )
+    for group in CF1_TABLE
+}
+
+
+def spacing_for_all_posts(
+    wind_speed_mph: float,
+    exposure: str,
+    cf3: float = DEFAULT_CF3,
+) -> Iterator[tuple[str, float]]:
+    """Yield ``(post_key, S_max)`` for every post in the catalog.
+
+    Same result as calling :func:`compute_max_spacing_cf` per post, but
+    Cf1 is interpolated once per group instead of once per post.
+    """
+    cf2 = EXPOSURE_CF2[exposure]
+    for group, posts in _POSTS_BY_GROUP.items():
+        if not posts:
+            continue
+        cf1 = get_cf1(group, wind_speed_mph)
+        for key, s_table in posts:
+            yield key, s_table * cf1 * cf2 * cf3
+
+
+def make_spacing_fn(
+    post_key: str | PostType,
+    exposure: str,
+    cf3: float = DEFAULT_CF3,
+) -> Callable[[float], float]:
+    """Return ``S_max(wind_speed_mph)`` specialised for one post and exposure.
+
+    S_table, Cf2 and Cf3 are folded into a single constant up front, so
+    sweeping wind speeds only interpolates Cf1 and does one multiply.
+    Results agree with :func:`compute_max_spacing_cf` to rounding.
+    """
+    post = _resolve_post(post_key)
+    group = post.group
+    const = post.spacing_base_ft * EXPOSURE_CF2[exposure] * cf3
+
+    def spacing(wind_speed_mph: float) -> float:
+        return const * get_cf1(group, wind_speed_mph)
+
+    return spacing
+
+
 def section_modulus_pipe(od_in: float, wall_in: float) -> float:
     """Section modulus S (in^3) for hollow circular tube."""
     D = od_in  # noqa: N806
@@ -454,10 +530,14 @@ def section_modulus_pipe(od_in: float, wall_in: float) -> float:
     return S
 
 
+# ASD safety factor for flexure (AISC F1)
+_OMEGA_BENDING = 1.67
+
+
 def bending_capacity_lb_in(
     S_in3: float,  # noqa: N803
     fy_ksi: float,
-    omega: float = 1.67,
+    omega: float = _OMEGA_BENDING,
 ) -> float:
     """Allowable moment in lb-in."""
     fy_psi = fy_ksi * 1000.0
@@ -465,8 +545,20 @@ def bending_capacity_lb_in(
     return M_allow
 
 
+def _moment_core(
+    S_in3: float,  # noqa: N803
+    fy_ksi: float,
+    height_ft: float,
+    load_per_post_lb: float,
+) -> tuple[float, float, bool]:
+    """Numeric core of :func:`compute_moment_check`."""
+    M_allow = fy_ksi * 1000.0 * S_in3 / _OMEGA_BENDING  # noqa: N806
+    M_demand = load_per_post_lb * (0.5 * height_ft * 12.0)  # noqa: N806
+    return (M_demand, M_allow, M_demand <= M_allow)
+
+
 def compute_moment_check(
-    post_key: str,
+    post_key: str | PostType,
     height_ft: float,
     load_per_post_lb: float,
 ) -> tuple[float, float, bool]:
@@ -489,7 +581,7 @@ def compute_moment_check(
     tuple[float, float, bool]
         ``(M_demand_lb_in, M_allow_lb_in, is_ok)``
     """
-    post = POST_TYPES[post_key]
+    post = _resolve_post(post_key)
 
     # 1) Determine section modulus
     if post.section_modulus_in3 is not None:
@@ -500,20 +592,51 @@ def compute_moment_check(
         # No geometry (e.g. C-shapes without Sx) -> skip check
         return (0.0, 0.0, True)
 
-    # 2) Allowable moment (ASD, omega = 1.67)
+    # 2) Allowable moment (ASD, omega = 1.67) and demand at H/2
+    return _moment_core(S, post.fy_ksi, height_ft, load_per_post_lb)
+
+
+def _no_bending_check(height_ft: float, load_per_post_lb: float) -> tuple[float, float, bool]:
+    return (0.0, 0.0, True)
+
+
+def make_bending_fn(
+    post_key: str | PostType,
+) -> Callable[[float, float], tuple[float, float, bool]]:
+    """Return a :func:`compute_moment_check` specialised for one post.
+
+    The allowable moment ``Fy * S / omega`` is computed once; the returned
+    ``check(height_ft, load_per_post_lb)`` only forms the demand moment.
+    """
+    post = _resolve_post(post_key)
+    if post.section_modulus_in3 is not None:
+        S = post.section_modulus_in3  # noqa: N806
+    elif post.od_in is not None and post.wall_in is not None:
+        S = section_modulus_pipe(post.od_in, post.wall_in)  # noqa: N806
+    else:
+        # No geometry (e.g. C-shapes without Sx) -> check always passes
+        return _no_bending_check
+
     M_allow = bending_capacity_lb_in(S, post.fy_ksi)  # noqa: N806
 
-    # 3) Demand moment: uniform pressure resultant at H/2
-    lever_arm_in = 0.5 * height_ft * 12.0
-    M_demand = load_per_post_lb * lever_arm_in  # noqa: N806
+    def check(height_ft: float, load_per_post_lb: float) -> tuple[float, float, bool]:
+        M_demand = load_per_post_lb * (0.5 * height_ft * 12.0)  # noqa: N806
+        return (M_demand, M_allow, M_demand <= M_allow)
 
-    is_ok = M_demand <= M_allow
-    return (M_demand, M_allow, is_ok)
+    return check
 
 
 # Table-based spacing lookup
 TABLE_DIR = Path(__file__).resolve().parent / "data" / "WLC Tables"
 
+# Upper-cased CSV group cell -> PostGroup key
+_GROUP_LOOKUP: dict[str, PostGroup] = {
+    "IA_REG": "IA_REG",
+    "IA_HIGH": "IA_HIGH",
+    "IC_PIPE": "IC_PIPE",
+    "II_CSHAPE": "II_CSHAPE",
+}
+
 # Available wind speed tables (will be populated if tables exist)
 _AVAILABLE_WS: list[int] = []
 
@@ -523,84 +646,148 @@ if TABLE_DIR.exists():
     )
 
 
+_WsRow = tuple[str, str, dict[float, float]]
+
+
+def _parse_height(col_val: object) -> float:
+    try:
+        return float(str(col_val).strip())
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _read_ws_rows_pandas(path: Path) -> list[_WsRow]:
+    """Parse a spacing table with pandas' C parser.
+
+    Numeric coercion of the spacing cells happens in bulk; ``-``, empty
+    and other non-numeric cells become NaN and are dropped from the
+    per-row map. Pandas' default NA strings are disabled so that labels
+    and header cells such as ``NA`` come through as text, matching
+    :func:`_read_ws_rows_csv`.
+    """
+    import pandas as pd
+
+    raw = pd.read_csv(
+        path,
+        header=None,
+        dtype=str,
+        encoding="utf-8-sig",
+        keep_default_na=False,
+        skipinitialspace=True,
+    )
+    if len(raw) < 2 or raw.shape[1] < 3:
+        return []
+
+    height_cols = [_parse_height(v) for v in raw.iloc[0, 2:]]
+    body = raw.iloc[1:]
+    labels = body.iloc[:, :2]
+    values = body.iloc[:, 2:].apply(pd.to_numeric, errors="coerce").to_numpy()
+
+    rows: list[_WsRow] = []
+    for group_str, label_str, cells in zip(
+        labels.iloc[:, 0], labels.iloc[:, 1], values, strict=True
+    ):
+        spacing_map = {
+            h: float(v) for h, v in zip(height_cols, cells, strict=False) if pd.notna(v)
+        }
+        rows.append((group_str.strip(), label_str.strip(), spacing_map))
+    return rows
+
+
+def _read_ws_rows_csv(path: Path) -> list[_WsRow]:
+    """Pure-stdlib fallback for :func:`_read_ws_rows_pandas`."""
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        all_rows = list(reader)
+
+    if len(all_rows) < 2:
+        return []
+
+    # Parse header: Group, Post Label, height1, height2, ...
+    height_cols = [_parse_height(v) for v in all_rows[0][2:]]
+
+    rows: list[_WsRow] = []
+    for row in all_rows[1:]:
+        if len(row) < 3:
+            continue
+        spacing_map: dict[float, float] = {}
+        for i, col_val in enumerate(row[2:]):
+            if i >= len(height_cols):
+                break
+            h = height_cols[i]
+            val = col_val.strip()
+            if val and val != "-":
+                try:
+                    spacing = float(val)
+                except ValueError:
+                    continue
+                if not math.isnan(spacing):
+                    spacing_map[h] = spacing
+        rows.append((row[0].strip(), row[1].strip(), spacing_map))
+    return rows
+
+
+# (sorted heights_ft, spacing_ft per height) for one table row
+_SpacingRow = tuple[tuple[float, ...], tuple[float, ...]]
+
+
 @lru_cache(maxsize=32)
-def _load_ws_tables(ws_mph: int) -> dict[PostGroup, dict[str, dict[float, float]]]:
+def _load_ws_tables(ws_mph: int) -> dict[PostGroup, dict[str, _SpacingRow]]:
     """
     Parse one <ws>mph.csv into:
-      { group: { table_label: { height_ft: spacing_ft } } }
+      { group: { table_label: (heights_ft, spacings_ft) } }
 
-    Returns empty dicts if file doesn't exist or can't be parsed.
+    Heights are sorted ascending so lookups can bisect directly.
+    Uses pandas when available and falls back to :mod:`csv` when pandas is
+    missing or rejects the file. Returns empty dicts if the file doesn't
+    exist, and warns if it exists but can't be read.
     """
     path = TABLE_DIR / f"{ws_mph}mph.csv"
-    tables: dict[PostGroup, dict[str, dict[float, float]]] = {
+    maps: dict[PostGroup, dict[str, dict[float, float]]] = {
         "IA_REG": {},
         "IA_HIGH": {},
         "IC_PIPE": {},
         "II_CSHAPE": {},
     }
 
-    if not path.exists():
-        return tables
-
-    try:
-        with path.open(newline="", encoding="utf-8-sig") as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-
-        if len(rows) < 2:
-            return tables
-
-        # Parse header: Group, Post Label, height1, height2, ...
-        header = rows[0]
-        height_cols: list[float] = []
-        for col_val in header[2:]:
+    if path.exists():
+        try:
             try:
-                height_cols.append(float(col_val.strip()))
-            except (ValueError, TypeError):
-                height_cols.append(0.0)
+                rows = _read_ws_rows_pandas(path)
+            except (ImportError, ValueError):
+                # No pandas, or its parser rejected the file (ParserError is a
+                # ValueError, e.g. on a ragged row); the csv reader tolerates it.
+                rows = _read_ws_rows_csv(path)
+        except (OSError, ValueError, csv.Error) as exc:
+            warnings.warn(
+                f"Could not read spacing table {path.name} ({exc}); "
+                "falling back to Cf1/Cf2 spacing.",
+                stacklevel=2,
+            )
+            rows = []
 
-        # Parse data rows
-        for row in rows[1:]:
-            if len(row) < 3:
-                continue
-            group_str = row[0].strip()
-            label_str = row[1].strip()
-
-            # Match group
-            group: PostGroup | None = None
-            for g in ("IA_REG", "IA_HIGH", "IC_PIPE", "II_CSHAPE"):
-                if group_str.upper() == g:
-                    group = g  # type: ignore[assignment]
-                    break
+        for group_str, label_str, spacing_map in rows:
+            group = _GROUP_LOOKUP.get(group_str.upper())
             if group is None:
                 continue
-
-            spacing_map: dict[float, float] = {}
-            for i, col_val in enumerate(row[2:]):
-                if i >= len(height_cols):
-                    break
-                h = height_cols[i]
-                val = col_val.strip()
-                if val and val != "-":
-                    try:
-                        spacing_map[h] = float(val)
-                    except ValueError:
-                        continue
+            label_str = sys.intern(label_str)
 
             if spacing_map:
-                if label_str not in tables[group]:
-                    tables[group][label_str] = {}
-                tables[group][label_str].update(spacing_map)
-
-    except Exception:
-        # If parsing fails, return empty tables (Cf1/Cf2 fallback)
-        pass
-
+                if label_str not in maps[group]:
+                    maps[group][label_str] = {}
+                maps[group][label_str].update(spacing_map)
+
+    tables: dict[PostGroup, dict[str, _SpacingRow]] = {}
+    for group, labels in maps.items():
+        tables[group] = {}
+        for label, row in labels.items():
+            heights = tuple(sorted(row))
+            tables[group][label] = (heights, tuple(row[h] for h in heights))
     return tables
 
 
 def compute_max_spacing_from_tables(
-    post_key: str,
+    post_key: str | PostType,
     wind_speed_mph: float,
     height_ft: float,
 ) -> float | None:
@@ -608,7 +795,7 @@ def compute_max_spacing_from_tables(
     Look up max spacing from CSV tables if available.
     Returns None if tables don't exist or post isn't found.
     """
-    post = POST_TYPES[post_key]
+    post = _resolve_post(post_key)
     if not post.table_label:
         return None  # nothing to look up
 
@@ -616,8 +803,8 @@ def compute_max_spacing_from_tables(
     if not _AVAILABLE_WS:
         return None  # no tables available
 
-    ws_candidates = [ws for ws in _AVAILABLE_WS if ws >= wind_speed_mph]
-    ws_use = _AVAILABLE_WS[-1] if not ws_candidates else ws_candidates[0]
+    idx = bisect_left(_AVAILABLE_WS, wind_speed_mph)
+    ws_use = _AVAILABLE_WS[idx] if idx < len(_AVAILABLE_WS) else _AVAILABLE_WS[-1]
 
     all_tables = _load_ws_tables(ws_use)
     group_tables = all_tables.get(post.group, {})
@@ -626,20 +813,10 @@ def compute_max_spacing_from_tables(
         return None
 
     # Choose height column: smallest tabulated height >= requested height
-    heights = sorted(h for h in row if h is not None)
-    if not heights:
-        return None
-
-    chosen_h = None
-    for h in heights:
-        if h >= height_ft:
-            chosen_h = h
-            break
-    if chosen_h is None:
-        chosen_h = heights[-1]  # if fence taller than table, use most conservative
-
-    spacing = row[chosen_h]
-    return spacing
+    heights, spacings = row
+    idx = bisect_left(heights, height_ft)
+    # if fence taller than table, use most conservative
+    return spacings[idx] if idx < len(heights) else spacings[-1]
 
 
 def moment_of_inertia_pipe(od_in: float, wall_in: float) -> float:
@@ -650,7 +827,7 @@ def moment_of_inertia_pipe(od_in: float, wall_in: float) -> float:
 
 
 def compute_deflection_check(
-    post_key: str,
+    post_key: str | PostType,
     height_ft: float,
     load_per_post_lb: float,
     deflection_limit_ratio: float = 60.0,
@@ -665,8 +842,8 @@ def compute_deflection_check(
 
     Parameters
     ----------
-    post_key : str
-        Catalog key for the post.
+    post_key : str or PostType
+        Catalog key for the post, or an already-resolved PostType.
     height_ft : float
         Post height above grade in feet.
     load_per_post_lb : float
@@ -679,7 +856,7 @@ def compute_deflection_check(
     tuple[float, float, bool]
         ``(deflection_in, allowable_in, is_ok)``
     """
-    post = POST_TYPES[post_key]
+    post = _resolve_post(post_key)
 
     if post.od_in is None or post.wall_in is None:
         return (0.0, 0.0, True)
@@ -718,7 +895,10 @@ __all__ = [
     "compute_moment_check",
     "get_cf1",
     "get_pipe_post_keys",
+    "make_bending_fn",
+    "make_spacing_fn",
     "moment_of_inertia_pipe",
     "section_modulus_pipe",
+    "spacing_for_all_posts",
 ]
 
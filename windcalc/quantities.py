@@ -9,7 +9,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 
-from windcalc.post_catalog import POST_TYPES
+from windcalc.post_catalog import POST_TYPES, PostType
 
 
 @dataclass(frozen=True)
@@ -38,12 +38,57 @@ class SegmentQuantities:
     terminal_post_length_ft: float = 0.0
 
 
+@dataclass(frozen=True)
+class ProjectTotals:
+    """Point-in-time totals for a :class:`ProjectQuantities`."""
+
+    total_line_posts: int = 0
+    total_terminal_posts: int = 0
+    total_corner_posts: int = 0
+    total_gate_posts: int = 0
+    total_posts: int = 0
+    total_top_rail_lf: float = 0.0
+    total_fabric_sf: float = 0.0
+    total_concrete_cf: float = 0.0
+    total_concrete_cy: float = 0.0
+
+
 @dataclass
 class ProjectQuantities:
     """Aggregated material quantities across all segments."""
 
     segments: list[SegmentQuantities] = field(default_factory=list)
 
+    def totals_snapshot(self) -> ProjectTotals:
+        """Sum every quantity over ``segments`` in a single pass.
+
+        Prefer this over the individual ``total_*`` properties, which
+        each make their own pass, when more than one total is needed.
+        """
+        line = term = corner = gate = posts = 0
+        rail = fabric = concrete = 0.0
+        for s in self.segments:
+            line += s.num_line_posts
+            term += s.num_terminal_posts
+            corner += s.num_corner_posts
+            gate += s.num_gate_posts
+            posts += s.total_posts
+            rail += s.top_rail_lf
+            fabric += s.fabric_sf
+            concrete += s.total_concrete_cf
+        concrete_cf = round(concrete, 2)
+        return ProjectTotals(
+            total_line_posts=line,
+            total_terminal_posts=term,
+            total_corner_posts=corner,
+            total_gate_posts=gate,
+            total_posts=posts,
+            total_top_rail_lf=round(rail, 1),
+            total_fabric_sf=round(fabric, 1),
+            total_concrete_cf=concrete_cf,
+            total_concrete_cy=round(concrete_cf / 27.0, 2),
+        )
+
     @property
     def total_line_posts(self) -> int:
         return sum(s.num_line_posts for s in self.segments)
@@ -81,11 +126,46 @@ class ProjectQuantities:
         return round(self.total_concrete_cf / 27.0, 2)
 
 
-def _concrete_volume_cf(diameter_in: float, depth_in: float) -> float:
-    """Concrete volume for a cylindrical pier (cubic feet)."""
-    r_ft = (diameter_in / 2.0) / 12.0
-    d_ft = depth_in / 12.0
-    return math.pi * r_ft**2 * d_ft
+# Footing defaults used when a post key is missing or not in the catalog
+_DEFAULT_LINE_POST = PostType(
+    key="",
+    label="",
+    group="IC_PIPE",
+    footing_diameter_in=10.0,
+    footing_embedment_in=24.0,
+)
+_DEFAULT_TERM_POST = PostType(
+    key="",
+    label="",
+    group="IC_PIPE",
+    footing_diameter_in=16.0,
+    footing_embedment_in=36.0,
+)
+
+# pi * (D / 24)^2 * (depth / 12) with D and depth in inches -> ft^3
+_VOL_CONST = math.pi / 6912.0
+
+
+def _compute_segment_core(
+    height_ft: float,
+    num_line: int,
+    num_special: int,
+    line_dia_in: float,
+    line_embed_in: float,
+    term_dia_in: float,
+    term_embed_in: float,
+) -> tuple[float, float, float, float, float]:
+    """Numeric core of :func:`compute_segment_quantities`.
+
+    Returns ``(concrete_line_cf, concrete_term_cf, total_concrete_cf,
+    line_post_len_ft, term_post_len_ft)``; rounding stays in the wrapper.
+    """
+    concrete_line = _VOL_CONST * line_dia_in * line_dia_in * line_embed_in
+    concrete_term = _VOL_CONST * term_dia_in * term_dia_in * term_embed_in
+    total_concrete = num_line * concrete_line + num_special * concrete_term
+    line_post_len = height_ft + line_embed_in / 12.0
+    term_post_len = height_ft + term_embed_in / 12.0
+    return concrete_line, concrete_term, total_concrete, line_post_len, term_post_len
 
 
 def compute_segment_quantities(
@@ -136,33 +216,32 @@ def compute_segment_quantities(
     total = num_line + special_posts
 
     # Lookup footing defaults from catalog
-    line_post = POST_TYPES.get(line_post_key or "")
-    term_post = POST_TYPES.get(terminal_post_key or "")
-
-    line_footing_dia = footing_diameter_override_in or (
-        line_post.footing_diameter_in if line_post else 10.0
-    )
-    line_embed = embedment_override_in or (
-        line_post.footing_embedment_in if line_post else 24.0
-    )
-    term_footing_dia = footing_diameter_override_in or (
-        term_post.footing_diameter_in if term_post else 16.0
+    line_post = POST_TYPES.get(line_post_key or "", _DEFAULT_LINE_POST)
+    term_post = POST_TYPES.get(terminal_post_key or "", _DEFAULT_TERM_POST)
+
+    # Catalog entries and the sentinels all carry footing defaults; the
+    # trailing ``or 0.0`` only narrows the Optional field types.
+    line_footing_dia = footing_diameter_override_in or line_post.footing_diameter_in or 0.0
+    line_embed = embedment_override_in or line_post.footing_embedment_in or 0.0
+    term_footing_dia = footing_diameter_override_in or term_post.footing_diameter_in or 0.0
+    term_embed = embedment_override_in or term_post.footing_embedment_in or 0.0
+
+    # Concrete per footing and post total lengths (above grade + embedment)
+    (
+        concrete_line,
+        concrete_term,
+        total_concrete,
+        line_post_len,
+        term_post_len,
+    ) = _compute_segment_core(
+        height_ft,
+        num_line,
+        special_posts,
+        line_footing_dia,
+        line_embed,
+        term_footing_dia,
+        term_embed,
     )
-    term_embed = embedment_override_in or (
-        term_post.footing_embedment_in if term_post else 36.0
-    )
-
-    # Concrete per footing
-    concrete_line = _concrete_volume_cf(line_footing_dia, line_embed)
-    concrete_term = _concrete_volume_cf(term_footing_dia, term_embed)
-
-    total_concrete = (
-        num_line * concrete_line + special_posts * concrete_term
-    )
-
-    # Post total lengths (above grade + embedment)
-    line_post_len = height_ft + (line_embed / 12.0)
-    term_post_len = height_ft + (term_embed / 12.0)
 
     # Top rail and fabric
     top_rail = fence_length_ft
@@ -190,6 +269,7 @@ def compute_segment_quantities(
 
 __all__ = [
     "ProjectQuantities",
+    "ProjectTotals",
     "SegmentQuantities",
     "compute_segment_quantities",
 ]
@@ -0,0 +1,505 @@
+"""ReportLab layout for the PDF report.
+
+Builds the flowables for each report section and renders them to PDF
+bytes.  Kept apart from :mod:`windcalc.report` so that importing the
+report API does not load reportlab until a PDF is actually drawn.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (
+    Flowable,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from windcalc.schemas import EstimateInput, EstimateOutput
+
+# ── Shared styles (built once at import) ─────────────────────────────
+_STYLES = getSampleStyleSheet()
+
+_MONO_STYLE = ParagraphStyle("Mono", parent=_STYLES["Normal"], fontName="Courier", fontSize=9)
+_DISCLAIMER_STYLE = ParagraphStyle(
+    "Disclaimer",
+    parent=_STYLES["Normal"],
+    fontSize=7,
+    textColor=colors.grey,
+    leading=9,
+)
+
+# Two-column label/value tables (inputs and results)
+_KV_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (0, -1), colors.Color(0.93, 0.93, 0.93)),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+])
+_ASCE7_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.15, 0.25, 0.45)),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, -1), 8),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("BACKGROUND", (0, 1), (-1, -1), colors.Color(0.97, 0.97, 0.97)),
+    ("TOPPADDING", (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+])
+_LEGACY_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, -1), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+])
+_RATIO_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, -1), colors.lightgrey),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+])
+
+
+class _StatusBanner(Flowable):
+    """One-line coloured status banner drawn directly on the canvas.
+
+    The banner text never wraps, so it skips Paragraph line breaking.
+    """
+
+    _HEIGHT = 0.35 * inch
+    _FONT = ("Helvetica-Bold", 11)
+
+    def __init__(self, text: str, bg_color: colors.Color, text_color: colors.Color) -> None:
+        super().__init__()
+        self.text = text
+        self.bg_color = bg_color
+        self.text_color = text_color
+
+    def wrap(self, avail_width: float, avail_height: float) -> tuple[float, float]:
+        self.width = avail_width
+        self.height = self._HEIGHT
+        return self.width, self.height
+
+    def draw(self) -> None:
+        canv = self.canv
+        font_name, font_size = self._FONT
+        canv.saveState()
+        canv.setFillColor(self.bg_color)
+        canv.setStrokeColor(self.text_color)
+        canv.setLineWidth(1)
+        canv.rect(0, 0, self.width, self.height, fill=1, stroke=1)
+        canv.setFillColor(self.text_color)
+        canv.setFont(font_name, font_size)
+        canv.drawString(8, (self.height - font_size) / 2 + 2, self.text)
+        canv.restoreState()
+
+
+def _status_footer_style(name: str, text_color: colors.Color) -> ParagraphStyle:
+    """Return the footer style for one status, derived from ``Normal``."""
+    return ParagraphStyle(
+        f"StatusFooter{name}",
+        parent=_STYLES["Normal"],
+        fontSize=9,
+        textColor=text_color,
+    )
+
+
+_GREEN_BG, _GREEN_FG = colors.Color(0.85, 0.95, 0.85), colors.Color(0.0, 0.4, 0.0)
+_YELLOW_BG, _YELLOW_FG = colors.Color(1.0, 0.97, 0.80), colors.Color(0.6, 0.4, 0.0)
+_RED_BG, _RED_FG = colors.Color(1.0, 0.85, 0.85), colors.Color(0.6, 0.0, 0.0)
+
+# risk_status -> (banner text, background, text colour, footer markup, footer style)
+_STATUS_TABLE: dict[str, tuple[str, colors.Color, colors.Color, str, ParagraphStyle]] = {
+    "GREEN": (
+        "GREEN - Configuration is within recommended limits",
+        _GREEN_BG,
+        _GREEN_FG,
+        "<i>Meets preliminary structural criteria.</i>",
+        _status_footer_style("Green", _GREEN_FG),
+    ),
+    "YELLOW": (
+        "YELLOW - Configuration is near a structural limit (85-100%)",
+        _YELLOW_BG,
+        _YELLOW_FG,
+        "<i>Near-limit preliminary result - review recommended.</i>",
+        _status_footer_style("Yellow", _YELLOW_FG),
+    ),
+    "RED": (
+        "RED - Configuration exceeds structural limits",
+        _RED_BG,
+        _RED_FG,
+        "<i>NOT acceptable - change post size, spacing, or seek engineering.</i>",
+        _status_footer_style("Red", _RED_FG),
+    ),
+}
+_STATUS_FALLBACK = _STATUS_TABLE["RED"]
+
+
+@lru_cache(maxsize=64)
+def _heading_proto(text: str, style: str | ParagraphStyle) -> Paragraph:
+    return Paragraph(text, _STYLES[style] if isinstance(style, str) else style)
+
+
+def _heading(text: str, style: str | ParagraphStyle) -> Paragraph:
+    """Return a fixed-text paragraph without re-parsing its markup.
+
+    *style* is a name in the shared stylesheet or a module-level
+    :class:`ParagraphStyle`. The parsed prototype is cached per
+    ``(text, style)``; callers get a shallow copy so layout state is never
+    shared between documents.
+    """
+    return copy.copy(_heading_proto(text, style))
+
+
+# ReportLab's table layout grows faster than linearly with row count, so
+# long tables are emitted as a run of shorter ones.
+_MAX_TABLE_ROWS = 500
+
+
+def _emit_table(
+    story: list,
+    rows: list[list[Any]],
+    style: TableStyle,
+    col_widths: list[float] | None = None,
+    max_rows: int = _MAX_TABLE_ROWS,
+) -> None:
+    """Append *rows* to *story* as one or more tables of at most *max_rows*."""
+    for start in range(0, len(rows), max_rows):
+        table = Table(rows[start:start + max_rows], colWidths=col_widths)
+        table.setStyle(style)
+        story.append(table)
+
+
+def _bullet_paragraph(items: Sequence[str], style: ParagraphStyle) -> Paragraph:
+    """Render *items* as one paragraph of ``- item`` lines.
+
+    Items are plain text, so markup characters are escaped.
+    """
+    return Paragraph("<br/>".join(["- " + escape(item) for item in items]), style)
+
+
+def render_pdf(
+    input_data: EstimateInput | None,
+    result: EstimateOutput | None,
+    extra: dict[str, Any] | None = None,
+    risk_status: str | None = None,
+    risk_details: dict[str, Any] | None = None,
+    project_meta: dict[str, str] | None = None,
+) -> bytes:
+    """Lay out the report and return the finished PDF as bytes."""
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buf,
+        pagesize=letter,
+        topMargin=0.6 * inch,
+        bottomMargin=0.6 * inch,
+    )
+    styles = _STYLES
+    story = []
+
+    # ── Title & Project Metadata ─────────────────────────────────────
+    story.append(_heading("Wind Load Calculation Report", "Title"))
+
+    subtitle_parts = []
+    if project_meta:
+        if project_meta.get("project_name"):
+            subtitle_parts.append(f"<b>Project:</b> {project_meta['project_name']}")
+        if project_meta.get("location"):
+            subtitle_parts.append(f"<b>Location:</b> {project_meta['location']}")
+        if project_meta.get("estimator"):
+            subtitle_parts.append(f"<b>Estimator:</b> {project_meta['estimator']}")
+    subtitle_parts.append(
+        f"<b>Date:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
+    )
+    for part in subtitle_parts:
+        story.append(Paragraph(part, styles["Normal"]))
+    story.append(Spacer(1, 0.25 * inch))
+
+    # ── Input Section ────────────────────────────────────────────────
+    if input_data:
+        _input_section(story, input_data, styles)
+
+    # ── ASCE 7 Breakdown ─────────────────────────────────────────────
+    if result and result.shared.design_params:
+        _asce7_section(story, input_data, result, styles)
+
+    # ── Results Section ──────────────────────────────────────────────
+    if result:
+        _result_section(story, result, styles)
+
+    # ── Status Section ───────────────────────────────────────────────
+    if risk_status and risk_details:
+        _status_section(story, risk_status, risk_details, styles)
+
+    # ── Legacy Section ───────────────────────────────────────────────
+    if extra:
+        _legacy_section(story, _LegacyView.from_dict(extra), styles)
+
+    # ── Footer Disclaimer ────────────────────────────────────────────
+    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(
+        "This report is generated by the HFC Wind Load Calculator for "
+        "estimation purposes only. It does not replace a licensed "
+        "Professional Engineer's sealed calculations. Verify all values "
+        "against project drawings and local building code requirements.",
+        _DISCLAIMER_STYLE,
+    ))
+
+    doc.build(story)
+    return buf.getvalue()
+
+
+def _input_section(
+    story: list,
+    data: EstimateInput,
+    styles: dict[str, ParagraphStyle],
+) -> None:
+    story.append(_heading("<b>Input Parameters</b>", "Heading2"))
+
+    rows = [
+        ["Wind Speed", f"{data.wind_speed_mph} mph"],
+        ["Exposure Category", data.exposure],
+        ["Risk Category", data.risk_category],
+        ["Fence Height", f"{data.height_total_ft} ft"],
+        ["Post Spacing", f"{data.post_spacing_ft} ft"],
+        ["Bay Area", f"{data.area_per_bay_ft2:.1f} sq ft"],
+    ]
+    if data.fence_length_ft:
+        bs = data.aspect_ratio_bs
+        bs_str = f" (B/s = {bs:.1f})" if bs else ""
+        rows.append(["Fence Run Length", f"{data.fence_length_ft:.0f} ft{bs_str}"])
+    if data.fence_type:
+        rows.append(["Fence Type", data.fence_type.replace("_", " ").title()])
+    if data.soil_type and data.soil_type != "default":
+        rows.append(["Soil Type", data.soil_type])
+
+    _emit_table(story, rows, _KV_TABLE_STYLE, [2.5 * inch, 4.0 * inch])
+    story.append(Spacer(1, 0.2 * inch))
+
+
+def _asce7_section(
+    story: list,
+    input_data: EstimateInput | None,
+    result: EstimateOutput,
+    styles: dict[str, ParagraphStyle],
+) -> None:
+    """ASCE 7-22 intermediate calculation breakdown."""
+    dp = result.shared.design_params
+    if not dp:
+        return
+
+    story.append(_heading("<b>ASCE 7-22 Calculation Breakdown</b>", "Heading2"))
+
+    mono = _MONO_STYLE
+
+    ws = input_data.wind_speed_mph if input_data else "V"
+    story.append(Paragraph(
+        f"qz = 0.00256 x Kz x Kzt x Kd x V^2 = "
+        f"0.00256 x {dp.kz:.3f} x {dp.kzt} x {dp.kd} x {ws}^2 = "
+        f"<b>{dp.qz_psf:.2f} psf</b>",
+        mono,
+    ))
+    story.append(Paragraph(
+        f"p  = qz x G x Cf = {dp.qz_psf:.2f} x {dp.g} x {dp.cf:.3f} = "
+        f"<b>{result.shared.pressure_psf:.2f} psf</b>",
+        mono,
+    ))
+    story.append(Spacer(1, 0.1 * inch))
+
+    rows = [
+        ["Parameter", "Value", "Reference"],
+        ["Kz (exposure coeff.)", f"{dp.kz:.4f}", "Table 26.10-1"],
+        ["Kzt (topographic)", f"{dp.kzt}", "Section 26.8"],
+        ["Kd (directionality)", f"{dp.kd}", "Table 26.6-1"],
+        ["G (gust-effect)", f"{dp.g}", "Section 26.11"],
+        ["Cf,solid", f"{dp.cf_solid:.3f}", "Figure 29.3-1"],
+        ["Solidity (epsilon)", f"{dp.solidity:.2f}", "Fence type"],
+        ["Cf (net)", f"{dp.cf:.3f}", "Cf,solid x epsilon"],
+        ["qz", f"{dp.qz_psf:.2f} psf", "Eq. 26.10-1"],
+    ]
+
+    _emit_table(story, rows, _ASCE7_TABLE_STYLE, [2.0 * inch, 1.5 * inch, 2.5 * inch])
+    story.append(Spacer(1, 0.2 * inch))
+
+
+def _recommendation_cell(result: EstimateOutput) -> str:
+    rec = result.recommended
+    post = rec.post_label or rec.post_key or rec.post_size or "N/A"
+    dia = rec.footing_diameter_in or "N/A"
+    emb = rec.embedment_in or "N/A"
+    return f"{post} footing {dia} in dia x {emb} in"
+
+
+def _result_section(
+    story: list,
+    result: EstimateOutput,
+    styles: dict[str, ParagraphStyle],
+) -> None:
+    story.append(_heading("<b>Results Summary</b>", "Heading2"))
+
+    rows = [
+        ["Design Pressure", f"{result.pressure_psf:.2f} psf"],
+        ["Total Bay Load", f"{result.total_load_lb:.0f} lb"],
+        ["Load Per Post", f"{result.load_per_post_lb:.0f} lb"],
+    ]
+
+    # Line post
+    line = result.line
+    rows.append(["Line Post", line.recommended.post_label or "Auto"])
+    if line.max_spacing_ft:
+        rows.append(["  Max Spacing (Line)", f"{line.max_spacing_ft:.2f} ft"])
+    if line.spacing_ratio is not None:
+        rows.append(["  Spacing Utilization", f"{line.spacing_ratio:.0%}"])
+    if line.moment_ratio is not None:
+        rows.append(["  Bending Utilization", f"{line.moment_ratio:.0%} (advisory)"])
+
+    # Terminal post
+    term = result.terminal
+    rows.append(["Terminal Post", term.recommended.post_label or "Auto"])
+    if term.max_spacing_ft:
+        rows.append(["  Max Spacing (Terminal)", f"{term.max_spacing_ft:.2f} ft"])
+    if term.moment_ratio is not None:
+        rows.append(["  Bending Utilization", f"{term.moment_ratio:.0%}"])
+
+    _emit_table(story, rows, _KV_TABLE_STYLE, [2.5 * inch, 4.0 * inch])
+    story.append(Spacer(1, 0.2 * inch))
+
+    if result.warnings:
+        story.append(_heading("<b>Warnings</b>", "Heading3"))
+        story.append(_bullet_paragraph(result.warnings, styles["Normal"]))
+        story.append(Spacer(1, 0.1 * inch))
+
+    if result.assumptions:
+        story.append(_heading("<b>Assumptions</b>", "Heading3"))
+        story.append(_bullet_paragraph(result.assumptions, styles["Normal"]))
+
+
+@dataclass(slots=True)
+class _LegacyView:
+    """Flattened view of the legacy ``generate_pdf_report`` payload."""
+
+    design_pressure: Any = "N/A"
+    total_load: Any = "N/A"
+    height: Any = "N/A"
+    width: Any = "N/A"
+    material: Any = "N/A"
+    location: Any = "N/A"
+    wind_speed: Any = "N/A"
+    exposure_category: Any = "N/A"
+    importance_factor: Any = "N/A"
+    calculation_notes: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _LegacyView:
+        fence_specs = data.get("fence_specs") or {}
+        wind_cond = data.get("wind_conditions") or {}
+        view = cls(calculation_notes=data.get("calculation_notes"))
+        for source, names in (
+            (data, ("design_pressure", "total_load")),
+            (fence_specs, ("height", "width", "material", "location")),
+            (wind_cond, ("wind_speed", "exposure_category", "importance_factor")),
+        ):
+            for name in names:
+                if name in source:
+                    setattr(view, name, source[name])
+        return view
+
+    def fence_rows(self) -> list[list[Any]]:
+        return [
+            ["Height", f"{self.height} ft"],
+            ["Width", f"{self.width} ft"],
+            ["Material", self.material],
+            ["Location", self.location],
+        ]
+
+    def wind_rows(self) -> list[list[Any]]:
+        return [
+            ["Wind Speed", f"{self.wind_speed} mph"],
+            ["Exposure Category", self.exposure_category],
+            ["Importance Factor", self.importance_factor],
+        ]
+
+    def result_rows(self) -> list[list[Any]]:
+        return [
+            ["Design Pressure", f"{self.design_pressure} psf"],
+            ["Total Load", f"{self.total_load} lbs"],
+        ]
+
+
+def _legacy_section(
+    story: list,
+    view: _LegacyView,
+    styles: dict[str, ParagraphStyle],
+) -> None:
+    story.append(_heading("<b>Legacy Summary</b>", "Heading2"))
+
+    for title, rows in (
+        ("Fence Specifications", view.fence_rows()),
+        ("Wind Conditions", view.wind_rows()),
+        ("Calculation Results", view.result_rows()),
+    ):
+        story.append(_heading(f"<b>{title}</b>", "Heading3"))
+        _emit_table(story, rows, _LEGACY_TABLE_STYLE)
+        story.append(Spacer(1, 0.1 * inch))
+
+    if view.calculation_notes:
+        story.append(
+            Paragraph(f"<b>Notes:</b> {view.calculation_notes}", styles["Normal"])
+        )
+
+
+def _status_section(
+    story: list,
+    risk_status: str,
+    risk_details: dict[str, Any],
+    styles: dict[str, ParagraphStyle],
+) -> None:
+    """Add structural status section to PDF."""
+    story.append(_heading("<b>Structural Status</b>", "Heading2"))
+
+    status_text, bg_color, text_color, status_footer, footer_style = _STATUS_TABLE.get(
+        risk_status, _STATUS_FALLBACK
+    )
+    story.append(_StatusBanner(status_text, bg_color, text_color))
+    story.append(Spacer(1, 0.15 * inch))
+
+    if risk_details.get("reasons"):
+        story.append(_heading("<b>Status Details:</b>", "Heading3"))
+        story.append(_bullet_paragraph(risk_details["reasons"], styles["Normal"]))
+        story.append(Spacer(1, 0.1 * inch))
+
+    ratio_rows = []
+    if risk_details.get("line_spacing_ratio") is not None:
+        ratio_rows.append([
+            "Line Spacing Utilization",
+            f"{risk_details['line_spacing_ratio']:.1%}",
+        ])
+    if risk_details.get("terminal_bending_ratio") is not None:
+        ratio_rows.append([
+            "Terminal Bending Utilization",
+            f"{risk_details['terminal_bending_ratio']:.1%}",
+        ])
+
+    if ratio_rows:
+        _emit_table(story, ratio_rows, _RATIO_TABLE_STYLE, [3.0 * inch, 2.0 * inch])
+        story.append(Spacer(1, 0.1 * inch))
+
+    story.append(_heading(status_footer, footer_style))
+    story.append(Spacer(1, 0.2 * inch))
+
+
+__all__ = ["render_pdf"]
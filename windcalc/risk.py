@@ -27,104 +27,114 @@ _RED_THRESHOLD = 1.0
 def classify_risk(
     out: EstimateOutput,
     data: dict[str, Any],
+    *,
+    build_details: bool = True,
 ) -> tuple[str, dict[str, Any]]:
     """Classify risk status (GREEN / YELLOW / RED).
 
     Uses spacing and bending utilization ratios from the engine output.
     The engine already computes per-block status; this function aggregates
     them and builds human-readable detail strings for the UI and PDF.
+
+    With ``build_details=False`` the reason lists are left empty and no
+    message strings are formatted; the status and the numeric ratios in
+    *details* are still filled in.
     """
+    reasons: list[str] = []
+    advanced: list[str] = []
     details: dict[str, Any] = {
-        "reasons": [],
-        "advanced_reasons": [],
+        "reasons": reasons,
+        "advanced_reasons": advanced,
         "line_spacing_ratio": None,
         "line_max_spacing_ft": None,
         "terminal_bending_ratio": None,
     }
 
     # Use engine-computed overall status as the primary source
-    status = out.overall_status if hasattr(out, "overall_status") else "GREEN"
+    status = getattr(out, "overall_status", "GREEN")
+    line: Any = getattr(out, "line", None)
+    term: Any = getattr(out, "terminal", None)
+    raw_spacing = data.get("post_spacing_ft", 0)
+    spacing_ft = float(raw_spacing or 0)
 
     # ── Line spacing info ────────────────────────────────────────────
-    if hasattr(out, "line") and out.line.max_spacing_ft:
-        spacing_ratio = out.line.spacing_ratio
+    max_spacing = line.max_spacing_ft if line is not None else None
+    if max_spacing:
+        spacing_ratio = line.spacing_ratio
         if spacing_ratio is None:
-            spacing_ft = data.get("post_spacing_ft", 0)
-            if isinstance(spacing_ft, str):
-                spacing_ft = float(spacing_ft)
-            spacing_ratio = spacing_ft / out.line.max_spacing_ft
+            spacing_ratio = spacing_ft / max_spacing
 
         details["line_spacing_ratio"] = spacing_ratio
-        details["line_max_spacing_ft"] = out.line.max_spacing_ft
+        details["line_max_spacing_ft"] = max_spacing
 
-        if spacing_ratio > _RED_THRESHOLD:
-            details["reasons"].append(
-                f"Line spacing at {spacing_ratio * 100:.0f}% of limit "
-                f"({data.get('post_spacing_ft', 0)} ft "
-                f"vs {out.line.max_spacing_ft:.2f} ft max)"
+        if build_details and spacing_ratio > _RED_THRESHOLD:
+            reasons.append(
+                f"Line spacing at {spacing_ratio:.0%} of limit "
+                f"({raw_spacing} ft vs {max_spacing:.2f} ft max)"
             )
-        elif spacing_ratio > _YELLOW_THRESHOLD:
-            details["reasons"].append(
-                f"Line spacing near limit at {spacing_ratio * 100:.0f}% "
-                f"({data.get('post_spacing_ft', 0)} ft "
-                f"vs {out.line.max_spacing_ft:.2f} ft max) "
+        elif build_details and spacing_ratio > _YELLOW_THRESHOLD:
+            reasons.append(
+                f"Line spacing near limit at {spacing_ratio:.0%} "
+                f"({raw_spacing} ft vs {max_spacing:.2f} ft max) "
                 "- review recommended"
             )
 
     # ── Terminal bending info ────────────────────────────────────────
-    if hasattr(out, "terminal") and out.terminal.M_allow_ft_lb:
-        ratio = out.terminal.moment_ratio
-        if ratio is None and out.terminal.M_demand_ft_lb and out.terminal.M_allow_ft_lb:
-            ratio = out.terminal.M_demand_ft_lb / out.terminal.M_allow_ft_lb
+    m_allow = term.M_allow_ft_lb if term is not None else None
+    if m_allow:
+        m_demand = term.M_demand_ft_lb
+        ratio = term.moment_ratio
+        if ratio is None and m_demand:
+            ratio = m_demand / m_allow
 
         details["terminal_bending_ratio"] = ratio
-        if ratio is not None:
-            msg = (
-                f"Terminal bending utilization: {ratio * 100:.0f}% "
-                f"({out.terminal.M_demand_ft_lb:.1f} / "
-                f"{out.terminal.M_allow_ft_lb:.1f} ft-lb)"
+        if build_details and ratio is not None:
+            reasons.append(
+                f"Terminal bending utilization: {ratio:.0%} "
+                f"({m_demand:.1f} / {m_allow:.1f} ft-lb)"
             )
-            details["reasons"].append(msg)
+
+    if not build_details:
+        return status, details
 
     # ── Line bending advisory ────────────────────────────────────────
-    if hasattr(out, "line") and out.line.M_allow_ft_lb:
-        ratio = out.line.moment_ratio
-        if ratio is None and out.line.M_demand_ft_lb and out.line.M_allow_ft_lb:
-            ratio = out.line.M_demand_ft_lb / out.line.M_allow_ft_lb
+    m_allow = line.M_allow_ft_lb if line is not None else None
+    if m_allow:
+        m_demand = line.M_demand_ft_lb
+        ratio = line.moment_ratio
+        if ratio is None and m_demand:
+            ratio = m_demand / m_allow
 
         if ratio is not None:
-            msg = (
+            advanced.append(
                 "Advisory - Simplified cantilever bending check (conservative): "
-                f"{ratio * 100:.0f}% "
-                f"({out.line.M_demand_ft_lb:.1f} / "
-                f"{out.line.M_allow_ft_lb:.1f} ft-lb)"
+                f"{ratio:.0%} ({m_demand:.1f} / {m_allow:.1f} ft-lb)"
             )
-            details["advanced_reasons"].append(msg)
+
+    blocks = (("Line", line), ("Terminal", term))
 
     # ── Footing check ─────────────────────────────────────────────────
-    for role_name, block in [("Line", out.line), ("Terminal", out.terminal)]:
-        if block.footing and not block.footing.footing_ok:
-            msg = (
-                f"{role_name} footing SF = {block.footing.safety_factor:.2f} "
-                f"(need ≥ 1.50). Min embedment: "
-                f"{block.footing.min_embedment_ft:.1f} ft."
-            )
-            details["reasons"].append(msg)
-        elif block.footing and block.footing.safety_factor < 2.0:
-            msg = (
-                f"{role_name} footing SF = {block.footing.safety_factor:.2f} "
-                f"(adequate but marginal)."
+    for role_name, block in blocks:
+        footing = block.footing if block is not None else None
+        if not footing:
+            continue
+        sf = footing.safety_factor
+        if not footing.footing_ok:
+            reasons.append(
+                f"{role_name} footing SF = {sf:.2f} (need >= 1.50). "
+                f"Min embedment: {footing.min_embedment_ft:.1f} ft."
             )
-            details["advanced_reasons"].append(msg)
+        elif sf < 2.0:
+            advanced.append(f"{role_name} footing SF = {sf:.2f} (adequate but marginal).")
 
     # ── Deflection check ──────────────────────────────────────────────
-    for role_name, block in [("Line", out.line), ("Terminal", out.terminal)]:
-        if block.deflection and not block.deflection.deflection_ok:
-            msg = (
-                f"{role_name} deflection {block.deflection.deflection_in:.2f} in "
-                f"exceeds L/60 limit ({block.deflection.allowable_in:.2f} in)."
+    for role_name, block in blocks:
+        deflection = block.deflection if block is not None else None
+        if deflection and not deflection.deflection_ok:
+            advanced.append(
+                f"{role_name} deflection {deflection.deflection_in:.2f} in "
+                f"exceeds L/60 limit ({deflection.allowable_in:.2f} in)."
             )
-            details["advanced_reasons"].append(msg)
 
     return status, details
 
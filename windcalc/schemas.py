@@ -2,13 +2,86 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Any, Literal, Self
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    computed_field,
+)
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from pydantic_core import core_schema
+
+from windcalc.asce7 import FenceTypeKey
+from windcalc.footing import SoilClassKey
+
+
+class _Base(BaseModel):
+    """Common base: validators and serializers are built on first use.
+
+    Most entry points (CLI, reports, a single API route) touch only a few
+    of these models, so building every schema at import is wasted work.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+# FastAPI wraps request bodies in a TypeAdapter that inherits defer_build and
+# then trips over the deferred schema when the route is first called, so the
+# models accepted as API request bodies opt back into eager building.
+_EAGER = ConfigDict(defer_build=False)
+
+# Result blocks are written once by the engine and only read afterwards.
+# Their field descriptions are attribute docstrings, so the JSON schema
+# keeps per-field docs without a Field() wrapper on every field.
+_FROZEN = ConfigDict(frozen=True, extra="forbid", use_attribute_docstrings=True)
+
+# Flat numeric check records are frozen slots dataclasses rather than models:
+# no per-instance __dict__ or fields-set bookkeeping.
+_RECORD = ConfigDict(defer_build=True, extra="forbid")
+
+
+class _Result(_Base):
+    """Base for engine result blocks, which are assembled from computed values."""
+
+    @classmethod
+    def build(cls, **values: Any) -> Self:
+        """Construct without validation.
+
+        Only for values the engine has just computed and that already have
+        the declared types; request data goes through normal validation.
+        """
+        return cls.model_construct(**values)
+
+
+class _UpperCase:
+    """Annotation marker: upper-case string input before the annotated check.
+
+    The upper-casing runs inside pydantic-core as the first step of a chain,
+    so there is no Python validator call per construction. The JSON schema
+    is the annotated type's own (e.g. the Literal enum).
+    """
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.chain_schema([core_schema.str_schema(to_upper=True), handler(source)])
+
+    def __get_pydantic_json_schema__(
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return handler(schema["steps"][-1])
+
+
+# Exposure category; lower-case input ("c") is accepted and stored upper-case.
+_Exposure = Annotated[Literal["B", "C", "D"], _UpperCase()]
 
 
 # Legacy schemas retained for backward compatibility with the JSON API.
-class FenceSpecs(BaseModel):
+class FenceSpecs(_Base):
     """Fence specifications for wind load calculation."""
 
     height: float = Field(..., description="Fence height in feet", gt=0)
@@ -17,7 +90,7 @@ class FenceSpecs(BaseModel):
     location: str = Field(..., description="Installation location")
 
 
-class WindConditions(BaseModel):
+class WindConditions(_Base):
     """Wind conditions for calculation."""
 
     wind_speed: float = Field(..., description="Design wind speed in mph", gt=0)
@@ -25,15 +98,17 @@ class WindConditions(BaseModel):
     importance_factor: float = Field(default=1.0, description="Importance factor", gt=0)
 
 
-class WindLoadRequest(BaseModel):
+class WindLoadRequest(_Base):
     """Request model for wind load calculation."""
 
+    model_config = _EAGER
+
     fence: FenceSpecs
     wind: WindConditions
     project_name: str | None = Field(None, description="Optional project identifier")
 
 
-class WindLoadResult(BaseModel):
+class WindLoadResult(_Base):
     """Result model for wind load calculation."""
 
     project_name: str | None = None
@@ -45,9 +120,11 @@ class WindLoadResult(BaseModel):
 
 
 # Wizard-friendly schemas
-class Recommendation(BaseModel):
+class Recommendation(_Base):
     """Recommended post and footing selection."""
 
+    model_config = _FROZEN
+
     post_key: str | None = Field(None, description="Catalog key for the recommended post")
     post_label: str | None = Field(
         None, description="Human-friendly label sourced from POST_TYPES"
@@ -63,9 +140,16 @@ class Recommendation(BaseModel):
     embedment_in: float | None = Field(None, description="Embedment depth in inches")
 
 
-class EstimateInput(BaseModel):
+# Shared "no post chosen" value; Recommendation is frozen, so one instance serves
+# all. model_construct keeps the schema build deferred until first real use.
+_EMPTY_RECOMMENDATION = Recommendation.model_construct()
+
+
+class EstimateInput(_Base):
     """Inputs for a bay-style wind load estimate."""
 
+    model_config = _EAGER
+
     wind_speed_mph: float = Field(
         ..., gt=0, le=300, description="Design wind speed in mph (ASCE 7 range)"
     )
@@ -84,10 +168,10 @@ class EstimateInput(BaseModel):
             "If omitted, B/s >= 20 (long run) is assumed."
         ),
     )
-    exposure: Literal["B", "C", "D"] = Field(
+    exposure: _Exposure = Field(
         default="C", description="Exposure category (B, C, or D)"
     )
-    fence_type: str = Field(
+    fence_type: FenceTypeKey = Field(
         default="chain_link_open",
         description="Fence type key (determines solidity ratio and Cf)",
     )
@@ -95,7 +179,7 @@ class EstimateInput(BaseModel):
         default="III",
         description="Risk category (I-IV) per ASCE 7-22 Table 1.5-1",
     )
-    soil_type: str | None = Field(
+    soil_type: SoilClassKey | None = Field(
         None, description="Soil class key for footing check (e.g. 'sand', 'clay')"
     )
     # Topographic factor Kzt (ASCE 7-22 Section 26.8)
@@ -145,18 +229,13 @@ class EstimateInput(BaseModel):
         description="Legacy post size override string (e.g., '2-3/8\" SS40'); prefer post_key",
     )
 
-    @field_validator("exposure", mode="before")
-    @classmethod
-    def _normalize_exposure(cls, v: str) -> str:
-        return v.upper() if isinstance(v, str) else v
-
-    @computed_field
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def area_per_bay_ft2(self) -> float:
         """Calculated tributary area for a single bay."""
         return self.height_total_ft * self.post_spacing_ft
 
-    @computed_field
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def aspect_ratio_bs(self) -> float | None:
         """B/s aspect ratio (fence length / height), or None if length unknown."""
@@ -165,28 +244,35 @@ class EstimateInput(BaseModel):
         return None
 
 
-class DesignParameters(BaseModel):
+class DesignParameters(_Base):
     """ASCE 7-22 intermediate calculation values for traceability."""
 
-    asce7_edition: str = Field(default="ASCE 7-22", description="Code edition")
-    kz: float = Field(..., description="Velocity pressure exposure coefficient")
-    kzt: float = Field(default=1.0, description="Topographic factor")
-    kd: float = Field(..., description="Wind directionality factor")
-    g: float = Field(..., description="Gust-effect factor (rigid)")
-    cf_solid: float = Field(
-        ..., description="Force coefficient for solid wall (ASCE 7-22 Fig. 29.3-1)"
-    )
-    cf: float = Field(
-        ..., description="Net force coefficient (Cf_solid x solidity)"
-    )
-    solidity: float = Field(
-        ..., description="Solidity ratio epsilon (0-1)"
-    )
-    fence_type: str = Field(..., description="Fence type key")
-    qz_psf: float = Field(..., description="Velocity pressure in psf")
-
-
-class FootingResult(BaseModel):
+    model_config = _FROZEN
+
+    asce7_edition: str = "ASCE 7-22"
+    """Code edition."""
+    kz: float
+    """Velocity pressure exposure coefficient."""
+    kzt: float = 1.0
+    """Topographic factor."""
+    kd: float
+    """Wind directionality factor."""
+    g: float
+    """Gust-effect factor (rigid)."""
+    cf_solid: float
+    """Force coefficient for solid wall (ASCE 7-22 Fig. 29.3-1)."""
+    cf: float
+    """Net force coefficient (Cf_solid x solidity)."""
+    solidity: float
+    """Solidity ratio epsilon (0-1)."""
+    fence_type: FenceTypeKey
+    """Fence type key."""
+    qz_psf: float
+    """Velocity pressure in psf."""
+
+
+@pydantic_dataclass(frozen=True, slots=True, config=_RECORD)
+class FootingResult:
     """Results from the IBC 1807.3 lateral soil resistance check."""
 
     overturning_moment_ft_lb: float = 0.0
@@ -200,7 +286,8 @@ class FootingResult(BaseModel):
     concrete_volume_cf: float = 0.0
 
 
-class DeflectionResult(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True, config=_RECORD)
+class DeflectionResult:
     """Results from the post deflection (serviceability) check."""
 
     deflection_in: float = 0.0
@@ -209,7 +296,11 @@ class DeflectionResult(BaseModel):
     ratio: float = 0.0
 
 
-class SharedResult(BaseModel):
+class SharedResult(_Result):
+    """Pressure and bay loads common to the line and terminal blocks."""
+
+    model_config = _FROZEN
+
     pressure_psf: float
     area_per_bay_ft2: float
     total_load_lb: float
@@ -217,30 +308,34 @@ class SharedResult(BaseModel):
     design_params: DesignParameters | None = None
 
 
-class BlockResult(BaseModel):
+class BlockResult(_Result):
+    """Checks for one post role (line or terminal)."""
+
+    model_config = _FROZEN
+
     post_key: str | None = None
     post_label: str | None = None
-    recommended: Recommendation
-    warnings: list[str] = Field(default_factory=list)
-    assumptions: list[str] = Field(default_factory=list)
+    recommended: Recommendation = Field(default_factory=lambda: _EMPTY_RECOMMENDATION)
+    warnings: tuple[str, ...] = ()
+    assumptions: tuple[str, ...] = ()
     max_spacing_ft: float | None = None
     M_demand_ft_lb: float | None = None
     M_allow_ft_lb: float | None = None
     moment_ok: bool | None = None
-    spacing_ratio: float | None = Field(
-        None, description="Requested spacing / max spacing (>1.0 = over limit)"
-    )
-    moment_ratio: float | None = Field(
-        None, description="M_demand / M_allow (>1.0 = over capacity)"
-    )
+    spacing_ratio: float | None = None
+    """Requested spacing / max spacing (>1.0 = over limit)."""
+    moment_ratio: float | None = None
+    """M_demand / M_allow (>1.0 = over capacity)."""
     footing: FootingResult | None = None
     deflection: DeflectionResult | None = None
     status: Literal["GREEN", "YELLOW", "RED"] = "GREEN"
 
 
-class QuantitiesResult(BaseModel):
+class QuantitiesResult(_Result):
     """Material quantity takeoff for a fence run."""
 
+    model_config = _FROZEN
+
     fence_length_ft: float = 0.0
     num_line_posts: int = 0
     num_terminal_posts: int = 0
@@ -255,7 +350,7 @@ class QuantitiesResult(BaseModel):
     terminal_post_length_ft: float = 0.0
 
 
-class EstimateOutput(BaseModel):
+class EstimateOutput(_Result):
     """Wind load estimate for a single bay."""
 
     # Combined response
@@ -264,40 +359,71 @@ class EstimateOutput(BaseModel):
     terminal: BlockResult
     overall_status: str = "GREEN"
     quantities: QuantitiesResult | None = None
-    # Legacy top-level fields (mapped to line block for compatibility)
-    pressure_psf: float = Field(
-        ..., description="Applied pressure in psf (legacy; line block)"
-    )
-    area_per_bay_ft2: float = Field(
-        ...,
-        description="Area of a single bay in square feet (legacy; line block)",
-    )
-    total_load_lb: float = Field(
-        ...,
-        description="Total load on a bay in pounds (legacy; line block)",
-    )
-    load_per_post_lb: float = Field(
-        ..., description="Load per post in pounds (legacy; line block)"
-    )
-    recommended: Recommendation
-    warnings: list[str] = Field(default_factory=list)
-    assumptions: list[str] = Field(default_factory=list)
-    max_spacing_ft: float | None = Field(
-        None,
-        description="Maximum recommended spacing for the chosen post (legacy; line block)",
-    )
-    M_demand_ft_lb: float | None = Field(
-        None,
-        description="Bending moment demand in ft-lb (legacy; line block)",
-    )
-    M_allow_ft_lb: float | None = Field(
-        None,
-        description="Allowable bending moment in ft-lb (legacy; line block)",
-    )
+    # Legacy top-level fields, derived from the shared/line blocks so they are
+    # stored once but still serialized for older API clients.
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def pressure_psf(self) -> float:
+        """Applied pressure in psf (legacy; shared block)."""
+        return self.shared.pressure_psf
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def area_per_bay_ft2(self) -> float:
+        """Area of a single bay in square feet (legacy; shared block)."""
+        return self.shared.area_per_bay_ft2
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_load_lb(self) -> float:
+        """Total load on a bay in pounds (legacy; shared block)."""
+        return self.shared.total_load_lb
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def load_per_post_lb(self) -> float:
+        """Load per post in pounds (legacy; shared block)."""
+        return self.shared.load_per_post_lb
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def recommended(self) -> Recommendation:
+        """Recommended post and footing (legacy; line block)."""
+        return self.line.recommended
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def warnings(self) -> tuple[str, ...]:
+        """Line and terminal warnings combined (legacy)."""
+        return self.line.warnings + self.terminal.warnings
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def assumptions(self) -> tuple[str, ...]:
+        """Design assumptions (legacy; line block)."""
+        return self.line.assumptions
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def max_spacing_ft(self) -> float | None:
+        """Maximum recommended spacing for the chosen post (legacy; line block)."""
+        return self.line.max_spacing_ft
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def M_demand_ft_lb(self) -> float | None:  # noqa: N802
+        """Bending moment demand in ft-lb (legacy; line block)."""
+        return self.line.M_demand_ft_lb
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def M_allow_ft_lb(self) -> float | None:  # noqa: N802
+        """Allowable bending moment in ft-lb (legacy; line block)."""
+        return self.line.M_allow_ft_lb
 
 
 # ── Fence concrete takeoff schemas ────────────────────────────────────
-class ConcreteHoleSpecInput(BaseModel):
+class ConcreteHoleSpecInput(_Base):
     """Single fence hole specification row for concrete estimating."""
 
     post_type: str = Field(default="", description="User-facing post type label")
@@ -306,9 +432,11 @@ class ConcreteHoleSpecInput(BaseModel):
     hole_count: int = Field(..., ge=1, le=100000, description="Number of holes")
 
 
-class ConcreteEstimateInput(BaseModel):
+class ConcreteEstimateInput(_Base):
     """Input model for fence concrete takeoff."""
 
+    model_config = _EAGER
+
     hole_specs: list[ConcreteHoleSpecInput] = Field(..., min_length=1)
     include_waste: bool = Field(
         default=False, description="Include waste factor in totals"
@@ -324,7 +452,7 @@ class ConcreteEstimateInput(BaseModel):
     estimator: str = ""
 
 
-class ConcreteHoleSpecOutput(BaseModel):
+class ConcreteHoleSpecOutput(_Base):
     """Calculated output for a single hole specification row."""
 
     post_type: str = ""
@@ -337,7 +465,7 @@ class ConcreteHoleSpecOutput(BaseModel):
     bags_60lb: int = 0
 
 
-class ConcreteEstimateOutput(BaseModel):
+class ConcreteEstimateOutput(_Base):
     """Calculated concrete takeoff summary."""
 
     rows: list[ConcreteHoleSpecOutput] = Field(default_factory=list)
@@ -354,14 +482,14 @@ class ConcreteEstimateOutput(BaseModel):
 
 # ── Multi-segment schemas ────────────────────────────────────────────
 
-class SegmentInput(BaseModel):
+class SegmentInput(_Base):
     """Input for a single fence segment in a multi-segment project."""
 
     label: str = Field(default="Segment 1", description="Segment label")
     height_total_ft: float = Field(..., gt=0, le=50)
     post_spacing_ft: float = Field(..., gt=0, le=30)
     fence_length_ft: float = Field(..., gt=0, le=50000)
-    fence_type: str = Field(default="chain_link_open")
+    fence_type: FenceTypeKey = Field(default="chain_link_open")
     line_post_key: str | None = None
     terminal_post_key: str | None = None
     gate_post_key: str | None = None
@@ -371,14 +499,16 @@ class SegmentInput(BaseModel):
     num_gates: int = Field(default=0, ge=0)
 
 
-class ProjectInput(BaseModel):
+class ProjectInput(_Base):
     """Multi-segment project input with shared wind parameters."""
 
+    model_config = _EAGER
+
     wind_speed_mph: float = Field(..., gt=0, le=300)
-    exposure: Literal["B", "C", "D"] = Field(default="C")
+    exposure: _Exposure = Field(default="C")
     risk_category: Literal["I", "II", "III", "IV"] = Field(default="III")
     kzt: float = Field(default=1.0, ge=1.0, le=3.0)
-    soil_type: str | None = None
+    soil_type: SoilClassKey | None = None
     embedment_depth_in: float | None = None
     footing_diameter_in: float | None = None
     segments: list[SegmentInput] = Field(..., min_length=1)
@@ -389,7 +519,7 @@ class ProjectInput(BaseModel):
     estimator: str = ""
 
 
-class SegmentOutput(BaseModel):
+class SegmentOutput(_Result):
     """Output for a single segment in a multi-segment project."""
 
     label: str = ""
@@ -397,10 +527,12 @@ class SegmentOutput(BaseModel):
     quantities: QuantitiesResult | None = None
 
 
-class ProjectOutput(BaseModel):
+class ProjectOutput(_Base):
     """Multi-segment project output with combined quantities."""
 
-    segments: list[SegmentOutput] = Field(default_factory=list)
+    model_config = _FROZEN
+
+    segments: tuple[SegmentOutput, ...] = ()
     overall_status: str = "GREEN"
     total_quantities: QuantitiesResult | None = None
 
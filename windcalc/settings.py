@@ -6,14 +6,21 @@ via environment variables prefixed with ``WINDCALC_``.
 Example:
     export WINDCALC_STRICT_FOOTING=true
     export WINDCALC_REPORT_DIR="~/custom_reports"
+
+Set ``WINDCALC_NO_ENV_FILE`` to skip reading ``.env`` entirely (e.g. for
+production or CLI batch runs where the environment is already complete).
 """
 
 from __future__ import annotations
 
+import json
+import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Annotated, Any
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -34,17 +41,34 @@ class Settings(BaseSettings):
     strict_footing: bool = False
 
     # File paths
-    report_dir: Path = Path.home() / "Windload Reports"
+    report_dir: Path = Field(default_factory=lambda: Path.home() / "Windload Reports")
 
-    # CORS origins (comma-separated in env var)
-    cors_origins: list[str] = [
+    # CORS origins (comma-separated in env var; a JSON array also works)
+    cors_origins: Annotated[tuple[str, ...], NoDecode] = (
         "http://localhost:3000",
         "http://localhost:5173",
         "http://localhost:8000",
-    ]
+    )
+
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_origins(cls, v: Any) -> Any:
+        if not isinstance(v, str):
+            return v
+        if v.lstrip().startswith("["):
+            return json.loads(v)
+        return tuple(origin.strip() for origin in v.split(",") if origin.strip())
+
+
+class _EnvOnlySettings(Settings):
+    """:class:`Settings` read from the environment only, never ``.env``."""
+
+    model_config = SettingsConfigDict(env_file=None)
 
 
 @lru_cache
 def get_settings() -> Settings:
     """Return cached application settings (singleton)."""
+    if os.environ.get("WINDCALC_NO_ENV_FILE"):
+        return _EnvOnlySettings()
     return Settings()
@@ -1,8 +1,18 @@
-"""Pandas-based data tables for windcalc."""
+"""Pandas-based data tables for windcalc.
 
-from typing import Any
+pandas is imported inside each function, so importing this module (or
+writing plain result rows with :func:`export_to_csv`) does not pay the
+pandas import cost.
+"""
 
-import pandas as pd
+from __future__ import annotations
+
+import csv
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def create_results_dataframe(results: list[dict[str, Any]]) -> pd.DataFrame:
@@ -15,6 +25,8 @@ def create_results_dataframe(results: list[dict[str, Any]]) -> pd.DataFrame:
     Returns:
         DataFrame with calculation results
     """
+    import pandas as pd
+
     if not results:
         return pd.DataFrame()
 
@@ -32,39 +44,75 @@ def create_summary_table(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Summary DataFrame with aggregated statistics
     """
+    import numpy as np
+    import pandas as pd
+
     if df.empty:
         return pd.DataFrame()
 
+    # One column-wise pass for both means; absent columns report 0
+    present = [col for col in ("design_pressure", "total_load") if col in df.columns]
+    means = df[present].agg("mean") if present else pd.Series(dtype="float64")
+
     summary = pd.DataFrame(
         {
             "metric": ["count", "mean_design_pressure", "mean_total_load"],
-            "value": [
-                len(df),
-                df["design_pressure"].mean() if "design_pressure" in df.columns else 0,
-                df["total_load"].mean() if "total_load" in df.columns else 0,
-            ],
+            "value": np.array(
+                [len(df), means.get("design_pressure", 0), means.get("total_load", 0)],
+                dtype="float64",
+            ),
         }
     )
     return summary
 
 
-def export_to_csv(df: pd.DataFrame, filepath: str) -> None:
+def export_to_csv(
+    df: pd.DataFrame | Sequence[Mapping[str, Any]], filepath: str
+) -> None:
     """
-    Export DataFrame to CSV file.
+    Export DataFrame (or raw result rows) to CSV file.
+
+    A list of result dicts is written directly with :class:`csv.DictWriter`,
+    without building a DataFrame. Column order (first appearance across the
+    rows) and blank cells for missing keys match ``pd.DataFrame(rows)``;
+    values are written with ``str()``, so an int column with gaps stays
+    ``3`` where pandas would upcast it to ``3.0``.
 
     Args:
-        df: DataFrame to export
+        df: DataFrame, or list of result dictionaries, to export
         filepath: Path to save CSV file
     """
-    df.to_csv(filepath, index=False)
+    if isinstance(df, Sequence):
+        fieldnames = list(dict.fromkeys(key for row in df for key in row))
+        with open(filepath, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(df)
+        return
+
+    df.to_csv(filepath, index=False, lineterminator="\n", chunksize=10_000)
 
 
 def export_to_excel(df: pd.DataFrame, filepath: str) -> None:
     """
     Export DataFrame to Excel file.
 
+    Rows are streamed through a write-only openpyxl workbook, so large
+    result tables are not held in memory as a full cell grid.
+
     Args:
         df: DataFrame to export
         filepath: Path to save Excel file
     """
-    df.to_excel(filepath, index=False, engine="openpyxl")
+    import pandas as pd
+    from openpyxl import Workbook
+
+    # Scalar NaN/None/NA cells are written as blanks
+    is_scalar, isna = pd.api.types.is_scalar, pd.isna
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append([str(col) for col in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        ws.append([None if is_scalar(value) and isna(value) else value for value in row])
+    wb.save(filepath)
@@ -13,133 +13,136 @@ the ATC Hazards by Location tool.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
 # ── Wind speed regions by ZIP prefix ────────────────────────────────
-# Format: {zip_prefix: (wind_speed_risk_II_mph, region_name)}
+# Sorted, disjoint half-open ranges of the integer 3-digit prefix
+# ("012" -> 12): (start, end, wind_speed_risk_II_mph, region_name).
+# Where a region sits inside a larger one (Virginia Tidewater, Maryland,
+# South Florida, Hawaii) the outer range is split around it.
 # These are approximate. Coastal areas may vary significantly
 # within the same prefix.
 
-_ZIP_WIND_MAP: dict[str, tuple[int, str]] = {}
-
-# Florida (high wind)
-for p in range(320, 340):
-    _ZIP_WIND_MAP[str(p)] = (150, "Florida")
-for p in [330, 331, 332, 333, 334]:
-    _ZIP_WIND_MAP[str(p)] = (170, "South Florida Coast")
-for p in [339]:
-    _ZIP_WIND_MAP[str(p)] = (160, "Florida Keys")
-
-# Gulf Coast (TX, LA, MS, AL)
-for p in range(700, 715):
-    _ZIP_WIND_MAP[str(p)] = (130, "Louisiana")
-for p in range(770, 780):
-    _ZIP_WIND_MAP[str(p)] = (130, "Texas Gulf Coast")
-for p in range(780, 800):
-    _ZIP_WIND_MAP[str(p)] = (115, "Texas Interior")
-for p in range(386, 398):
-    _ZIP_WIND_MAP[str(p)] = (120, "Mississippi")
-for p in range(350, 370):
-    _ZIP_WIND_MAP[str(p)] = (115, "Alabama")
-
-# Southeast Atlantic coast
-for p in range(270, 290):
-    _ZIP_WIND_MAP[str(p)] = (130, "North Carolina Coast")
-for p in range(290, 300):
-    _ZIP_WIND_MAP[str(p)] = (130, "South Carolina")
-for p in range(300, 320):
-    _ZIP_WIND_MAP[str(p)] = (120, "Georgia")
-
-# Virginia / Mid-Atlantic
-for p in range(220, 247):
-    _ZIP_WIND_MAP[str(p)] = (115, "Virginia")
-for p in range(230, 237):
-    _ZIP_WIND_MAP[str(p)] = (125, "Virginia Tidewater")
-for p in range(200, 220):
-    _ZIP_WIND_MAP[str(p)] = (115, "DC / Maryland")
-for p in range(206, 219):
-    _ZIP_WIND_MAP[str(p)] = (115, "Maryland")
-
-# Northeast
-for p in range(100, 150):
-    _ZIP_WIND_MAP[str(p)] = (110, "New York")
-for p in range(150, 200):
-    _ZIP_WIND_MAP[str(p)] = (105, "Pennsylvania")
-for p in range(10, 70):
-    _ZIP_WIND_MAP[str(p)] = (115, "New England")
-for p in range(70, 90):
-    _ZIP_WIND_MAP[str(p)] = (110, "New Jersey / Connecticut")
-
-# Midwest / Central
-for p in range(400, 430):
-    _ZIP_WIND_MAP[str(p)] = (105, "Kentucky")
-for p in range(430, 460):
-    _ZIP_WIND_MAP[str(p)] = (105, "Ohio")
-for p in range(460, 480):
-    _ZIP_WIND_MAP[str(p)] = (105, "Indiana")
-for p in range(480, 500):
-    _ZIP_WIND_MAP[str(p)] = (105, "Michigan")
-for p in range(500, 530):
-    _ZIP_WIND_MAP[str(p)] = (105, "Iowa / Minnesota")
-for p in range(530, 550):
-    _ZIP_WIND_MAP[str(p)] = (105, "Wisconsin")
-for p in range(550, 570):
-    _ZIP_WIND_MAP[str(p)] = (105, "Minnesota")
-for p in range(570, 590):
-    _ZIP_WIND_MAP[str(p)] = (115, "South Dakota")
-for p in range(590, 600):
-    _ZIP_WIND_MAP[str(p)] = (105, "Montana")
-for p in range(600, 630):
-    _ZIP_WIND_MAP[str(p)] = (105, "Illinois")
-for p in range(630, 660):
-    _ZIP_WIND_MAP[str(p)] = (105, "Missouri")
-for p in range(660, 680):
-    _ZIP_WIND_MAP[str(p)] = (115, "Kansas")
-for p in range(680, 700):
-    _ZIP_WIND_MAP[str(p)] = (115, "Nebraska")
-
-# Mountain West
-for p in range(800, 840):
-    _ZIP_WIND_MAP[str(p)] = (110, "Colorado / Wyoming")
-for p in range(840, 850):
-    _ZIP_WIND_MAP[str(p)] = (105, "Utah")
-for p in range(850, 870):
-    _ZIP_WIND_MAP[str(p)] = (105, "Arizona")
-for p in range(870, 885):
-    _ZIP_WIND_MAP[str(p)] = (110, "New Mexico")
-
-# Pacific West
-for p in range(900, 935):
-    _ZIP_WIND_MAP[str(p)] = (95, "California (Southern)")
-for p in range(935, 970):
-    _ZIP_WIND_MAP[str(p)] = (95, "California (Northern)")
-for p in range(970, 980):
-    _ZIP_WIND_MAP[str(p)] = (95, "Oregon")
-for p in range(980, 995):
-    _ZIP_WIND_MAP[str(p)] = (95, "Washington")
-
-# Alaska / Hawaii
-for p in range(995, 1000):
-    _ZIP_WIND_MAP[str(p)] = (120, "Alaska")
-_ZIP_WIND_MAP["967"] = (105, "Hawaii")
-_ZIP_WIND_MAP["968"] = (130, "Hawaii (Windward)")
+_RANGES: tuple[tuple[int, int, int, str], ...] = (
+    (10, 70, 115, "New England"),
+    (70, 90, 110, "New Jersey / Connecticut"),
+    (100, 150, 110, "New York"),
+    (150, 200, 105, "Pennsylvania"),
+    (200, 206, 115, "DC / Maryland"),
+    (206, 219, 115, "Maryland"),
+    (219, 220, 115, "DC / Maryland"),
+    (220, 230, 115, "Virginia"),
+    (230, 237, 125, "Virginia Tidewater"),
+    (237, 247, 115, "Virginia"),
+    (270, 290, 130, "North Carolina Coast"),
+    (290, 300, 130, "South Carolina"),
+    (300, 320, 120, "Georgia"),
+    (320, 330, 150, "Florida"),
+    (330, 335, 170, "South Florida Coast"),
+    (335, 339, 150, "Florida"),
+    (339, 340, 160, "Florida Keys"),
+    (350, 370, 115, "Alabama"),
+    (386, 398, 120, "Mississippi"),
+    (400, 430, 105, "Kentucky"),
+    (430, 460, 105, "Ohio"),
+    (460, 480, 105, "Indiana"),
+    (480, 500, 105, "Michigan"),
+    (500, 530, 105, "Iowa / Minnesota"),
+    (530, 550, 105, "Wisconsin"),
+    (550, 570, 105, "Minnesota"),
+    (570, 590, 115, "South Dakota"),
+    (590, 600, 105, "Montana"),
+    (600, 630, 105, "Illinois"),
+    (630, 660, 105, "Missouri"),
+    (660, 680, 115, "Kansas"),
+    (680, 700, 115, "Nebraska"),
+    (700, 715, 130, "Louisiana"),
+    (770, 780, 130, "Texas Gulf Coast"),
+    (780, 800, 115, "Texas Interior"),
+    (800, 840, 110, "Colorado / Wyoming"),
+    (840, 850, 105, "Utah"),
+    (850, 870, 105, "Arizona"),
+    (870, 885, 110, "New Mexico"),
+    (900, 935, 95, "California (Southern)"),
+    (935, 967, 95, "California (Northern)"),
+    (967, 968, 105, "Hawaii"),
+    (968, 969, 130, "Hawaii (Windward)"),
+    (969, 970, 95, "California (Northern)"),
+    (970, 980, 95, "Oregon"),
+    (980, 995, 95, "Washington"),
+    (995, 1000, 120, "Alaska"),
+)
 
 # Risk category multipliers (approximate scale from Risk Cat II base)
-_RISK_MULTIPLIER: dict[str, float] = {
+_RISK_MULTIPLIER: Mapping[str, float] = MappingProxyType({
     "I": 0.87,
     "II": 1.00,
     "III": 1.10,
     "IV": 1.15,
-}
+})
+
+
+_INVALID = "Invalid ZIP code"
+_NOT_FOUND = "ZIP code region not in database"
+
+
+# The per-prefix table is built on first lookup, not at import, so
+# importing the module costs only the _RANGES literal.
+
+
+@lru_cache(maxsize=1)
+def _results_by_risk() -> Mapping[str, tuple[tuple[int | None, str], ...]]:
+    """Ready ``(speed, region)`` result per prefix 000-999, per risk category.
+
+    Speeds are scaled by the risk multiplier here, once. Each range
+    shares one result tuple, and region names are interned so callers
+    comparing them against other interned names hit the identity fast path.
+    """
+    not_found: tuple[int | None, str] = (None, _NOT_FOUND)
+    results = {}
+    for rc, mult in _RISK_MULTIPLIER.items():
+        table = [not_found] * 1000
+        for start, end, base, region in _RANGES:
+            table[start:end] = [(round(base * mult), sys.intern(region))] * (end - start)
+        results[rc] = tuple(table)
+    return MappingProxyType(results)
+
+
+def _prefix_index(zip_code: str | bytes) -> int:
+    """Return the integer 3-digit prefix of *zip_code*, or -1 if it has none.
+
+    Works on the code points (or bytes) directly, so no prefix string is
+    sliced off per call. Anything other than ``str`` or ``bytes`` (NaN or an
+    int from an untyped pandas column) has no prefix: an int ZIP has already
+    lost its leading zeros.
+    """
+    if not isinstance(zip_code, (str, bytes)) or len(zip_code) < 3:
+        return -1
+    if isinstance(zip_code, str):
+        a, b, c = ord(zip_code[0]) - 48, ord(zip_code[1]) - 48, ord(zip_code[2]) - 48
+    else:
+        a, b, c = zip_code[0] - 48, zip_code[1] - 48, zip_code[2] - 48
+    if 0 <= a <= 9 and 0 <= b <= 9 and 0 <= c <= 9:
+        return a * 100 + b * 10 + c
+    return -1
 
 
 def lookup_wind_speed(
-    zip_code: str,
+    zip_code: str | bytes,
     risk_category: str = "II",
 ) -> tuple[int | None, str]:
     """Look up approximate ASCE 7-22 wind speed from ZIP code.
 
     Parameters
     ----------
-    zip_code : str
+    zip_code : str or bytes
         US 5-digit ZIP code.
     risk_category : str
         Risk category (I, II, III, IV).
@@ -147,22 +150,81 @@ def lookup_wind_speed(
     Returns
     -------
     tuple[int | None, str]
-        ``(wind_speed_mph, region_name)`` or ``(None, "Unknown region")``
-        if the ZIP prefix is not in the database.
+        ``(wind_speed_mph, region_name)``, ``(None, "Invalid ZIP code")``
+        if *zip_code* does not start with three digits, or
+        ``(None, "ZIP code region not in database")`` if the prefix is not
+        in the database.
+
+    Notes
+    -----
+    Results come from tables built from ``_RANGES`` on first use and kept
+    for the life of the process. Tests that patch ``_RANGES`` must call
+    ``cache_clear()`` on the ``lru_cache``-wrapped ``_*`` table builders.
+    """
+    prefix = _prefix_index(zip_code)
+    if prefix < 0:
+        return None, _INVALID
+
+    # Unknown risk categories use the unscaled Risk Category II speeds
+    results = _results_by_risk()
+    return (results.get(risk_category) or results["II"])[prefix]
+
+
+# ── Batch lookup ────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=8)
+def _speed_array(risk_category: str) -> np.ndarray:
+    """Risk-adjusted speed per prefix 000-999, then a trailing -1 slot.
+
+    Unmapped prefixes hold -1, and an invalid ZIP's prefix index of -1
+    lands on the trailing slot, so one gather covers every case.
     """
-    if not zip_code or len(zip_code) < 3:
-        return None, "Invalid ZIP code"
+    import numpy as np
+
+    results = _results_by_risk()
+    table = results.get(risk_category) or results["II"]
+    speeds = np.full(1001, -1, dtype=np.int16)
+    speeds[:1000] = [-1 if speed is None else speed for speed, _ in table]
+    speeds.flags.writeable = False
+    return speeds
 
-    prefix = zip_code[:3]
-    entry = _ZIP_WIND_MAP.get(prefix)
-    if entry is None:
-        return None, "ZIP code region not in database"
 
-    base_speed, region = entry
-    mult = _RISK_MULTIPLIER.get(risk_category, 1.0)
-    adjusted_speed = round(base_speed * mult)
+@lru_cache(maxsize=1)
+def _region_by_prefix() -> tuple[str, ...]:
+    """Region name or lookup message per prefix, with the same trailing slot."""
+    return (*(region for _, region in _results_by_risk()["II"]), _INVALID)
+
+
+def lookup_wind_speed_batch(
+    zip_codes: Iterable[str | bytes],
+    risk_category: str = "II",
+) -> tuple[np.ndarray, list[str]]:
+    """Look up wind speeds for many ZIP codes at once.
+
+    Parameters
+    ----------
+    zip_codes : iterable of str or bytes
+        US 5-digit ZIP codes (a list, a NumPy string or bytes array, or a
+        pandas column's values).
+    risk_category : str
+        Risk category (I, II, III, IV), applied to every ZIP code.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, list[str]]
+        ``(speeds, regions)``. ``speeds`` is an ``int16`` array of
+        risk-adjusted speeds in mph, with ``-1`` wherever
+        :func:`lookup_wind_speed` would return ``None``; ``regions`` holds
+        the matching region names or messages.
+    """
+    import numpy as np
 
-    return adjusted_speed, region
+    prefixes = np.fromiter((_prefix_index(z) for z in zip_codes), dtype=np.intp)
+    speeds = _speed_array(risk_category)[prefixes]
+    region_by_prefix = _region_by_prefix()
+    regions = [region_by_prefix[p] for p in prefixes.tolist()]
+    return speeds, regions
 
 
-__all__ = ["lookup_wind_speed"]
+__all__ = ["lookup_wind_speed", "lookup_wind_speed_batch"]